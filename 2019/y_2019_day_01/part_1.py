@@ -1,15 +1,28 @@
-"""Day 0 part 1 solution."""
+"""Day 1 part 1 solution."""
 import argparse
 from pathlib import Path
 
-import pytest
+import numpy as np
+
+from aoc.cache import cached_answer
+from aoc.parsers import text_to_integer_array
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
+def exact_sum(values: np.ndarray) -> int:
+    """Sum non-negative int64 values without overflow, by summing their high and low 32 bits separately."""
+    # Each partial sum fits in int64 for up to 2**30 values
+    return (int((values >> 32).sum()) << 32) + int((values & 0xFFFFFFFF).sum())
+
+
 def solve(text: str) -> int:
     """Solve the puzzle."""
-    return sum([int(int(line) / 3) - 2 for line in text.splitlines()])
+    masses = text_to_integer_array(text)
+    # Floor division keeps int64 exact, dividing floats loses precision above 2**53
+    return exact_sum(masses // 3) - 2 * len(masses)
 
 
 INPUT_S = """\
@@ -20,7 +33,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 34241),),
 )
@@ -41,10 +54,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
     if args.submit_solution:
         from aocd import submit
@@ -1,25 +1,49 @@
-"""Day 0 part 1 solution."""
+"""Day 1 part 2 solution."""
 import argparse
 from pathlib import Path
 
-import pytest
+import numpy as np
+
+from aoc.cache import cached_answer
+from aoc.parsers import text_to_integer_array
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
-def get_fuel_requirement(mass: int) -> int:
-    """Calculate the fuel required for a given mass."""
-    fuel = int(mass / 3) - 2
-    if fuel >= 0:
-        return mass + get_fuel_requirement(fuel)
-    else:
-        return mass
+def exact_sum(values: np.ndarray) -> int:
+    """Sum non-negative int64 values without overflow, by summing their high and low 32 bits separately."""
+    # Each partial sum fits in int64 for up to 2**30 values
+    return (int((values >> 32).sum()) << 32) + int((values & 0xFFFFFFFF).sum())
+
+
+def get_fuel_requirement(masses: np.ndarray, chunk_size: int = 1 << 16) -> int:
+    """
+    Calculate the fuel required for the masses, including the fuel for the fuel.
+
+    Every round computes the fuel for the fuel of the previous round, until no mass of a chunk needs more fuel. The
+    masses are processed in chunks that stay in the CPU cache over the rounds.
+    """
+    total = 0
+    for start in range(0, len(masses), chunk_size):
+        # Floor division keeps int64 exact, dividing floats loses precision above 2**53
+        fuel = masses[start : start + chunk_size] // 3 - 2
+        while True:
+            # Masses too small for fuel need none, rather than negative fuel
+            np.maximum(fuel, 0, out=fuel)
+            extra = exact_sum(fuel)
+            if not extra:
+                break
+            total += extra
+            fuel //= 3
+            fuel -= 2
+    return total
 
 
 def solve(text: str) -> int:
     """Solve the puzzle."""
-    fuel = [int(int(line) / 3) - 2 for line in text.splitlines()]
-    return sum([get_fuel_requirement(f) for f in fuel])
+    return get_fuel_requirement(text_to_integer_array(text))
 
 
 INPUT_S = """\
@@ -28,9 +52,14 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
-    ((INPUT_S, 50348),),
+    (
+        (INPUT_S, 50348),
+        # Masses below 9 need no fuel, the mass 3**38 + 5 is above 2**53 where float division loses precision
+        ("1\n8\n", 0),
+        (f"{3**38 + 5}\n", 675425858836495934),
+    ),
 )
 def test(input_s: str, expected: int) -> None:
     """Check that the solution is correct."""
@@ -49,10 +78,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
     if args.submit_solution:
         from aocd import submit
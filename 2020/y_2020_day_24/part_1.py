@@ -3,7 +3,8 @@ import argparse
 from pathlib import Path
 from typing import Dict, Tuple
 
-import pytest
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 CubeCoord = Tuple[int, int, int]
@@ -69,7 +70,7 @@ wseweeenwnesenwwwswnew
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 10),),
 )
@@ -82,10 +83,11 @@ def main() -> int:
     """Run the solution."""
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    add_profile_argument(parser)
     args = parser.parse_args()
 
     with open(args.data_file) as f:
-        print(solve(f.read()))
+        print(solve_profiled(solve, f.read(), args.profile))
 
     return 0
 
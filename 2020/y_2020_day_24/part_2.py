@@ -3,7 +3,9 @@ import argparse
 from pathlib import Path
 from typing import Dict, Set, Tuple
 
-import pytest
+from aoc.automaton import HEX, DenseAutomaton, Rule
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 CubeCoord = Tuple[int, int, int]
@@ -45,37 +47,16 @@ def get_initial_black_tiles(text: str) -> Set[CubeCoord]:
     return {k for k, v in tile_black.items() if v}
 
 
-def get_neigbors(coord: CubeCoord) -> Set[CubeCoord]:
-    """Get the neigbors of a cube coord."""
-    return {tuple(map(sum, zip(coord, effect))) for effect in direction_effects.values()}  # type: ignore
-
-
-def get_white_neigbor_tiles(black_tiles: Set[CubeCoord]) -> Set[CubeCoord]:
-    """Get white tiles that neighbor the black tiles."""
-    white_tiles = set()
-    for tile in black_tiles:
-        neigbors = get_neigbors(tile)
-        white_tiles.update(neigbors - black_tiles)
-    return white_tiles
-
-
-def n_neigbor_black_tiles(tile: CubeCoord, black_tiles: Set[CubeCoord]) -> int:
-    """Get the number of black tiles that are neighbors of a white tile."""
-    return len(get_neigbors(tile).intersection(black_tiles))
-
-
 def solve(text: str) -> int:
     """Solves the puzzle.
 
-    Directions are e, se, sw, w, nw, and ne
+    Black tiles with 1 or 2 black neighbours stay black, white tiles with 2 black neighbours flip to black.
     """
-    black_tiles = get_initial_black_tiles(text)
-    for _ in range(100):
-        white_tiles = get_white_neigbor_tiles(black_tiles)
-        new_black_tiles = {tile for tile in black_tiles if 0 < n_neigbor_black_tiles(tile, black_tiles) < 3}
-        new_black_tiles.update(tile for tile in white_tiles if n_neigbor_black_tiles(tile, black_tiles) == 2)
-        black_tiles = new_black_tiles.copy()
-    return len(black_tiles)
+    black_tiles = ((x, y) for x, y, _ in get_initial_black_tiles(text))
+    # Cube coordinates sum to 0, so the third one is left out to get the axial coordinates of HEX. The tiles fill
+    # most of their bounding box, which is where a dense array beats a set of tiles
+    automaton = DenseAutomaton.from_cells(black_tiles, HEX, Rule(birth=frozenset({2}), survival=frozenset({1, 2})))
+    return len(automaton.run(100))
 
 
 INPUT_S = """\
@@ -102,7 +83,7 @@ wseweeenwnesenwwwswnew
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 2208),),
 )
@@ -115,10 +96,11 @@ def main() -> int:
     """Run the solution."""
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    add_profile_argument(parser)
     args = parser.parse_args()
 
     with open(args.data_file) as f:
-        print(solve(f.read()))
+        print(solve_profiled(solve, f.read(), args.profile))
 
     return 0
 
@@ -2,34 +2,25 @@
 import argparse
 from pathlib import Path
 
-import pytest
+from aoc.cache import cached_answer
+from aoc.number_theory import discrete_log
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
+# The modulus is prime, so the multiplicative group has MODULUS - 1 elements
+MODULUS = 20201227
+SUBJECT_NR = 7
 
 
 def handshake(subject_nr: int, loop_size: int) -> int:
     """Perform full cryptographic handshake, result is private key."""
-    value = 1
-    for _ in range(loop_size):
-        value = transform_subject_nr(value, subject_nr)
-    return value
-
-
-def transform_subject_nr(value: int, subject_nr: int) -> int:
-    """Transform a subject number in context of a cryptographic handshake."""
-    value *= subject_nr
-    value = value % 20201227
-    return value
+    return pow(subject_nr, loop_size, MODULUS)
 
 
 def find_secret_loop_size(public_key: int) -> int:
-    """Find the secret loop size of a handshake."""
-    value = 1
-    loop_size = 0
-    while value != public_key:
-        value = transform_subject_nr(value, 7)
-        loop_size += 1
-    return loop_size
+    """Find the secret loop size of a handshake, the discrete log of the public key to the base 7."""
+    return discrete_log(SUBJECT_NR, public_key, MODULUS, MODULUS - 1)
 
 
 def solve(text: str) -> int:
@@ -46,7 +37,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 14897079),),
 )
@@ -67,10 +58,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
     if args.submit_solution:
         from aocd import submit
@@ -2,7 +2,9 @@
 import argparse
 from pathlib import Path
 
-import pytest
+from aoc.cache import cached_answer
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
@@ -16,7 +18,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 1),),
 )
@@ -37,10 +39,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
 
     if args.submit_solution:
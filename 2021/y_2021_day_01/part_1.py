@@ -3,9 +3,10 @@ import argparse
 from pathlib import Path
 
 import numpy as np
-import pytest
 
 from aoc.parsers import text_to_integer_array
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
@@ -30,7 +31,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 7),),
 )
@@ -43,10 +44,11 @@ def main() -> int:
     """Run the solution."""
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    add_profile_argument(parser)
     args = parser.parse_args()
 
     with open(args.data_file) as f:
-        print(solve(f.read()))
+        print(solve_profiled(solve, f.read(), args.profile))
 
     return 0
 
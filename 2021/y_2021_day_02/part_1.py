@@ -2,19 +2,22 @@
 import argparse
 from pathlib import Path
 
-import pytest
+from aoc.inputs import Lines, iter_lines, read_lines
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
+load = read_lines
 
 
-def solve(text: str) -> int:
+def solve(text: Lines) -> int:
     """Solves the puzzle."""
     direction_totals = {
         "forward": 0,
         "up": 0,
         "down": 0,
     }
-    for line in text.splitlines():
+    for line in iter_lines(text):
         k, v = line.split()
         direction_totals[k] += int(v)
 
@@ -31,7 +34,7 @@ forward 2
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 150),),
 )
@@ -44,10 +47,10 @@ def main() -> int:
     """Run the solution."""
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        print(solve(f.read()))
+    print(solve_profiled(solve, load(args.data_file), args.profile))
 
     return 0
 
@@ -2,20 +2,23 @@
 import argparse
 from pathlib import Path
 
-import pytest
+import numpy as np
 
-from aoc.parsers import unspaced_text_to_2d_list
+from aoc.inputs import map_input
+from aoc.parsers import Text, text_to_byte_grid
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
+load = map_input
 
 
-def solve(text: str) -> int:
+def solve(text: Text) -> int:
     """Solves the puzzle."""
-    x = unspaced_text_to_2d_list(text, int)
-    gamma_bit_list = [str(int(sum(column) > len(column) / 2)) for column in zip(*x)]
-    gamma_bits = "".join(gamma_bit_list)
-    epsilon_bits = "".join("1" if x == "0" else "0" for x in gamma_bits)
-    return int(gamma_bits, 2) * int(epsilon_bits, 2)
+    x = text_to_byte_grid(text, "0")
+    gamma_bits = x.sum(axis=0) > len(x) / 2
+    bit_values = 1 << np.arange(x.shape[1])[::-1]
+    return int(bit_values[gamma_bits].sum()) * int(bit_values[~gamma_bits].sum())
 
 
 INPUT_S = """\
@@ -34,7 +37,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 198),),
 )
@@ -47,10 +50,10 @@ def main() -> int:
     """Run the solution."""
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        print(solve(f.read()))
+    print(solve_profiled(solve, load(args.data_file), args.profile))
 
     return 0
 
@@ -1,41 +1,41 @@
 """Day 3 part 2 solution."""
 import argparse
 from pathlib import Path
-from typing import Any, List
 
-import pytest
+import numpy as np
 
-from aoc.parsers import unspaced_text_to_2d_list
+from aoc.inputs import map_input
+from aoc.parsers import Text, text_to_byte_grid
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
+load = map_input
 
 
-def filter(x: List[List[int]], criteria: str, bit_index: int = 0) -> List[Any]:
-    """Apply the a bit criteria to filter list of bits."""
+def filter(x: np.ndarray, criteria: str, bit_index: int = 0) -> np.ndarray:
+    """Apply the a bit criteria to filter 2D array of bits."""
     if len(x) > 1:
-        idx = bit_index % len(x[0])
-        bits_at_idx = [bits[idx] for bits in x]
+        idx = bit_index % x.shape[1]
+        bits_at_idx = x[:, idx]
         if criteria == "oxygen":
-            to_match = int(sum(bits_at_idx) >= len(x) / 2)
+            to_match = int(bits_at_idx.sum()) >= len(x) / 2
         elif criteria == "co2":
-            to_match = int(sum(bits_at_idx) < len(x) / 2)
+            to_match = int(bits_at_idx.sum()) < len(x) / 2
         else:
             raise ValueError(f"Invalid criteria: {criteria}")
-        return filter([bits for bits in x if bits[idx] == to_match], criteria, bit_index + 1)
+        return filter(x[bits_at_idx == to_match], criteria, bit_index + 1)
     else:
-        return [str(bit) for bit in x[0]]
+        return x[0, :]
 
 
-def solve(text: str) -> int:
+def solve(text: Text) -> int:
     """Solves the puzzle."""
-    x = unspaced_text_to_2d_list(text, int)
-    oxygen_bit_list = filter(x, "oxygen")
-    co2_bit_list = filter(x, "co2")
-
-    oxygen_bits = "".join(oxygen_bit_list)
-    co2_bits = "".join(co2_bit_list)
-
-    return int(oxygen_bits, 2) * int(co2_bits, 2)
+    x = text_to_byte_grid(text, "0")
+    bit_values = 1 << np.arange(x.shape[1])[::-1]
+    oxygen_bits = filter(x, "oxygen")
+    co2_bits = filter(x, "co2")
+    return int(oxygen_bits @ bit_values) * int(co2_bits @ bit_values)
 
 
 INPUT_S = """\
@@ -54,7 +54,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 230),),
 )
@@ -67,10 +67,10 @@ def main() -> int:
     """Run the solution."""
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        print(solve(f.read()))
+    print(solve_profiled(solve, load(args.data_file), args.profile))
 
     return 0
 
@@ -3,9 +3,13 @@ import argparse
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
-import pytest
+from aoc.cache import cached_answer
+from aoc.inputs import Lines, iter_lines, read_lines
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
+load = read_lines
 Coord = Tuple[int, int]
 
 
@@ -15,9 +19,9 @@ def coord_parser(text: str) -> Coord:
     return (x, y)
 
 
-def line_parser(text: str) -> Iterable[Tuple[Coord, Coord]]:
+def line_parser(text: Lines) -> Iterable[Tuple[Coord, Coord]]:
     """Parse the input."""
-    for line in text.splitlines():
+    for line in iter_lines(text):
         start_coord, end_coord = [coord_parser(x) for x in line.split(" -> ")]
         yield (start_coord, end_coord)
 
@@ -35,10 +39,10 @@ def end_coords_to_line(coord_pair: Tuple[Coord, Coord]) -> List[Coord]:
     return line
 
 
-def solve(text: str) -> int:
+def solve(text: Lines) -> int:
     """Solve the puzzle."""
-    coord_pairs: List[Tuple[Coord, Coord]] = list(line_parser(text))
-    horizontal_coord_pairs = [cp for cp in coord_pairs if cp[0][0] == cp[1][0] or cp[0][1] == cp[1][1]]
+    coord_pairs = line_parser(text)
+    horizontal_coord_pairs = (cp for cp in coord_pairs if cp[0][0] == cp[1][0] or cp[0][1] == cp[1][1])
     vent_dict: Dict[Coord, int] = {}
     for cp in horizontal_coord_pairs:
         line = end_coords_to_line(cp)
@@ -61,7 +65,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 5),),
 )
@@ -82,10 +86,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, load(args.data_file), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
     if args.submit_solution:
         from aocd import submit
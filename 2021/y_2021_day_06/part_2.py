@@ -3,17 +3,20 @@ import argparse
 from pathlib import Path
 from typing import Dict
 
-import pytest
+import numpy as np
+
+from aoc.cache import cached_answer
+from aoc.parsers import comma_separated_text_to_integer_array
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def parse_fish_age(text: str) -> Dict[int, int]:
     """Parse the input."""
-    fish_age_count: Dict[int, int] = {}
-    for age in text.split(","):
-        fish_age_count[int(age)] = fish_age_count.get(int(age), 0) + 1
-    return fish_age_count
+    ages, counts = np.unique(comma_separated_text_to_integer_array(text), return_counts=True)
+    return dict(zip(ages.tolist(), counts.tolist()))
 
 
 def solve(text: str) -> int:
@@ -33,7 +36,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 26984457539),),
 )
@@ -54,10 +57,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
     if args.submit_solution:
         from aocd import submit
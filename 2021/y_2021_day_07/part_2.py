@@ -1,30 +1,35 @@
 """Day 7 part 2 solution."""
 import argparse
 from pathlib import Path
-from typing import List
 
-import pytest
+import numpy as np
+
+from aoc.cache import cached_answer
+from aoc.parsers import comma_separated_text_to_integer_array
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
-def sum_of_absolute_differences(numbers: List[int], value: int) -> int:
+def sum_of_absolute_differences(numbers: np.ndarray, value: int) -> int:
     """Sum of absolute differences."""
-    return sum([abs(x - value) for x in numbers])
+    return int(np.abs(numbers - value).sum())
 
 
-def sum_of_absolute_triangular_differences(numbers: List[int], value: int) -> int:
+def sum_of_absolute_triangular_differences(numbers: np.ndarray, value: int) -> int:
     """Sum of absolute triangular differences.
 
     https://en.wikipedia.org/wiki/Triangular_number
     """
-    return sum([int(abs(x - value) * (abs(x - value) + 1) / 2) for x in numbers])
+    differences = np.abs(numbers - value)
+    return int((differences * (differences + 1) // 2).sum())
 
 
 def solve(text: str) -> int:
     """Solve the puzzle."""
-    locations = [int(x) for x in text.split(",")]
-    midpoint = int(round(sum(locations) / len(locations)))
+    locations = comma_separated_text_to_integer_array(text)
+    midpoint = int(round(locations.mean()))
     delta = sum_of_absolute_triangular_differences(locations, midpoint)
     if delta > sum_of_absolute_triangular_differences(locations, midpoint + 1):
         direction = 1
@@ -47,7 +52,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 168),),
 )
@@ -68,10 +73,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
     if args.submit_solution:
         from aocd import submit
@@ -1,61 +1,31 @@
 """Day 9 part 1 solution."""
 import argparse
 from pathlib import Path
-from typing import Iterator, List, Tuple
 
-import pytest
+import numpy as np
 
-from aoc.parsers import unspaced_text_to_2d_list
+from aoc.cache import cached_answer
+from aoc.inputs import map_input
+from aoc.parsers import Text, text_to_byte_grid
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
+load = map_input
 
 
-def get_value_and_neighbors(grid: List[List[int]]) -> Iterator[Tuple[int, int, int, int, int]]:
-    """Iterate over all values in the grid and their neighbors.
-
-    Parameters
-    ----------
-    grid : List[List[int]]
-        2D list of ints
-
-    Yields
-    ------
-    Iterator[Tuple[int, int, int, int, int]]
-        value, up, down, right, left
-    """
-    for y, row in enumerate(grid):
-        for x, value in enumerate(row):
-            if y == 0:
-                up = 10
-                down = grid[y + 1][x]
-            elif y == len(grid) - 1:
-                up = grid[y - 1][x]
-                down = 10
-            else:
-                up = grid[y - 1][x]
-                down = grid[y + 1][x]
-
-            if x == 0:
-                left = 10
-                right = row[x + 1]
-            elif x == len(row) - 1:
-                left = row[x - 1]
-                right = 10
-            else:
-                left = row[x - 1]
-                right = row[x + 1]
-
-            yield value, up, down, right, left
-
-
-def solve(text: str) -> int:
+def solve(text: Text) -> int:
     """Solve the puzzle."""
-    topography = unspaced_text_to_2d_list(text, int)
-    total = 0
-    for value, up, down, right, left in get_value_and_neighbors(topography):
-        if value < min(up, down, left, right):
-            total += value + 1
-    return total
+    # Pad with a height of 10 so edge points have a higher neighbor on the outside
+    topography = np.pad(text_to_byte_grid(text, "0"), 1, constant_values=10)
+    center = topography[1:-1, 1:-1]
+    is_low_point = (
+        (center < topography[:-2, 1:-1])  # up
+        & (center < topography[2:, 1:-1])  # down
+        & (center < topography[1:-1, :-2])  # left
+        & (center < topography[1:-1, 2:])  # right
+    )
+    return int((center[is_low_point].astype(int) + 1).sum())
 
 
 INPUT_S = """\
@@ -67,7 +37,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 15),),
 )
@@ -88,10 +58,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, load(args.data_file), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
     if args.submit_solution:
         from aocd import submit
@@ -3,19 +3,25 @@ import argparse
 from pathlib import Path
 
 import numpy as np
-import pytest
-from scipy.ndimage import measurements
 
-from aoc.parsers import unspaced_text_to_2d_array
+from aoc.cache import cached_answer
+from aoc.inputs import map_input
+from aoc.parsers import Text, text_to_byte_grid
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
+load = map_input
 
 
-def solve(text: str) -> int:
+def solve(text: Text) -> int:
     """Solve the puzzle."""
-    areas = unspaced_text_to_2d_array(text, int) < 9
-    labeled, clusters = measurements.label(areas)
-    sizes = measurements.sum(areas, labeled, index=range(clusters + 1))
+    # SciPy takes longer to import than most solutions take to run, only import it when the puzzle is solved
+    from scipy import ndimage
+
+    areas = text_to_byte_grid(text, "0") < 9
+    labeled, clusters = ndimage.label(areas)
+    sizes = ndimage.sum_labels(areas, labeled, index=range(clusters + 1))
 
     top_3 = sorted(sizes.astype(int))[-3:]
     return int(np.prod(top_3))
@@ -30,7 +36,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 1134),),
 )
@@ -51,10 +57,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, load(args.data_file), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
     if args.submit_solution:
         from aocd import submit
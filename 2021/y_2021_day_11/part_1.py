@@ -1,48 +1,48 @@
 """Day 11 part 1 solution."""
 import argparse
 from pathlib import Path
-from typing import Iterator, Set, Tuple
 
-import pytest
+import numpy as np
 
-Coord = Tuple[int, int]
-INPUT_TXT = Path(__file__).parent / "input.txt"
-
-
-def parse(text: str) -> Iterator[Tuple[Coord, int]]:
-    """Parse the input."""
-    for y, line in enumerate(text.splitlines()):
-        for x, value in enumerate(line):
-            yield (x, y), int(value)
+from aoc.cache import cached_answer
+from aoc.parsers import text_to_byte_grid
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
-
-def neighbors(x: int, y: int, max_x: int, max_y: int, min_x: int = 0, min_y: int = 0) -> Iterator[Coord]:
-    """Return the neighbors of a coordinate."""
-    for x2 in range(x - 1, x + 2):
-        for y2 in range(y - 1, y + 2):
-            if (x2, y2) != (x, y) and min_x <= x2 <= max_x and min_y <= y2 <= max_y:
-                yield x2, y2
+INPUT_TXT = Path(__file__).parent / "input.txt"
+# Offsets of the eight neighbours of an octopus
+NEIGHBOURS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+
+def step(energy: np.ndarray) -> np.ndarray:
+    """
+    Advance the energy levels one step in place and return the number of octopuses that flashed.
+
+    A batch of grids can be stacked along leading axes, flashes are then counted per grid. Flashes spread as a work
+    queue, every round only adds energy to the neighbours of the octopuses that just flashed.
+    """
+    # A border that never flashes keeps neighbours within the grid, also between the grids of a batch
+    pad_widths = [(0, 0)] * (energy.ndim - 2) + [(1, 1), (1, 1)]
+    padded = np.pad(energy.astype(np.int16) + 1, pad_widths, constant_values=np.iinfo(np.int16).min)
+    offsets = np.array([dy * padded.shape[-1] + dx for dx, dy in NEIGHBOURS])
+    flat = padded.reshape(-1)
+    flashing = np.flatnonzero(flat > 9)
+    while len(flashing):
+        neighbours, increments = np.unique((flashing[:, None] + offsets).ravel(), return_counts=True)
+        before = flat[neighbours]
+        flat[neighbours] = before + increments
+        # Octopuses flash once, when their energy goes past 9
+        flashing = neighbours[(before <= 9) & (before + increments > 9)]
+    flashed = padded[..., 1:-1, 1:-1] > 9
+    energy[...] = np.where(flashed, 0, padded[..., 1:-1, 1:-1])
+    flashes: np.ndarray = flashed.sum(axis=(-2, -1))
+    return flashes
 
 
 def solve(text: str) -> int:
     """Solve the puzzle."""
-    coord_to_energy = dict(parse(text))
-    all_coords = set(coord_to_energy.keys())
-    max_x = max(x for x, _ in all_coords)
-    max_y = max(y for _, y in all_coords)
-    total_flashed = 0
-    for _ in range(100):
-        coord_to_energy = {k: v + 1 for k, v in coord_to_energy.items()}
-        flashed: Set[Coord] = set()
-        while len(flashed) != len([energy for energy in coord_to_energy.values() if energy > 9]):
-            for coord in all_coords - flashed:
-                if coord_to_energy[coord] > 9:
-                    flashed.add(coord)
-                    for neighbor in list(neighbors(*coord, max_x, max_y)):
-                        coord_to_energy[neighbor] += 1
-        coord_to_energy = {k: (v if v <= 9 else 0) for k, v in coord_to_energy.items()}
-        total_flashed += len(flashed)
-    return total_flashed
+    energy = text_to_byte_grid(text, "0")
+    return int(sum(step(energy) for _ in range(100)))
 
 
 INPUT_S = """\
@@ -59,7 +59,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 1656),),
 )
@@ -80,10 +80,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
 
     if args.submit_solution:
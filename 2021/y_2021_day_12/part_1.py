@@ -4,7 +4,9 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Dict, Iterator, Set, Tuple
 
-import pytest
+from aoc.cache import cached_answer
+from aoc.profiling import add_profile_argument, profiled, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
@@ -16,6 +18,7 @@ def parse(text: str) -> Iterator[Tuple[str, str]]:
         yield start, end
 
 
+@profiled()
 def create_graph(text: str) -> Dict[str, Set[str]]:
     """Create a graph from the input."""
     graph = defaultdict(set)
@@ -92,7 +95,7 @@ start-RW
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     (
         (INPUT_S1, 10),
@@ -117,10 +120,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
 
     if args.submit_solution:
@@ -3,6 +3,8 @@ import argparse
 from pathlib import Path
 from typing import Iterator, List, Set, Tuple
 
+from aoc.profiling import add_profile_argument, solve_profiled
+
 Coord = Tuple[int, int]
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
@@ -78,10 +80,11 @@ def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("data_file", nargs="?", default=INPUT_TXT)
 
+    add_profile_argument(parser)
     args = parser.parse_args()
 
     with open(args.data_file) as f:
-        solve(f.read())
+        solve_profiled(solve, f.read(), args.profile)
     return 0
 
 
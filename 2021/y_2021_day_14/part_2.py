@@ -4,7 +4,9 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-import pytest
+from aoc.cache import cached_answer
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 Count = Dict[str, int]
@@ -82,7 +84,7 @@ CN -> C
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 2188189693529),),
 )
@@ -91,7 +93,7 @@ def test(input_s: str, expected: int) -> None:
     assert solve(input_s) == expected
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "iteration", "expected"),
     (
         (INPUT_S, 1, "NCNBCHB"),
@@ -127,10 +129,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
 
     if args.submit_solution:
@@ -1,40 +1,24 @@
 """Day 15 part 1 solution."""
 import argparse
 from pathlib import Path
-from typing import Dict, List, Tuple
 
-import pytest
-
-from aoc.compute import dijkstra
-from aoc.parsers import unspaced_text_to_2d_list
+from aoc.cache import cached_answer
+from aoc.compute import grid_dijkstra
+from aoc.inputs import map_input
+from aoc.parsers import Text, text_to_byte_grid
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
-Coord = Tuple[int, int]
-
-
-def build_graph(list_2d: List[List[int]]) -> Dict[Coord, Dict[Coord, int]]:
-    """Build a graph from the input text."""
-    graph: Dict[Coord, Dict[Coord, int]] = {}
-    for y, row in enumerate(list_2d):
-        for x, _ in enumerate(row):
-            graph[(x, y)] = {}
-            if x > 0:
-                graph[(x, y)][(x - 1, y)] = int(row[x - 1])
-            if x + 1 < len(row):
-                graph[(x, y)][(x + 1, y)] = int(row[x + 1])
-            if y > 0:
-                graph[(x, y)][(x, y - 1)] = int(list_2d[y - 1][x])
-            if y + 1 < len(list_2d):
-                graph[(x, y)][(x, y + 1)] = int(list_2d[y + 1][x])
-    return graph
-
-
-def solve(text: str) -> int:
+load = map_input
+
+
+def solve(text: Text) -> int:
     """Solve the puzzle."""
-    list_2d = unspaced_text_to_2d_list(text, int)
-    graph = build_graph(list_2d)
-    _, node_costs = dijkstra(graph, (0, 0))
-    return int(node_costs[(len(list_2d[0]) - 1, len(list_2d) - 1)])
+    risk_map = text_to_byte_grid(text, "0")
+    end = (risk_map.shape[1] - 1, risk_map.shape[0] - 1)
+    _, node_costs = grid_dijkstra(risk_map, (0, 0), targets={end})
+    return int(node_costs[-1, -1])
 
 
 INPUT_S = """\
@@ -51,7 +35,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 40),),
 )
@@ -72,10 +56,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, load(args.data_file), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
 
     if args.submit_solution:
@@ -1,67 +1,38 @@
 """Day 15 part 2 solution."""
 import argparse
 from pathlib import Path
-from typing import Dict, List, Tuple
 
-import pytest
+import numpy as np
 
-from aoc.compute import dijkstra
-from aoc.parsers import unspaced_text_to_2d_list
+from aoc.cache import cached_answer
+from aoc.compute import grid_dijkstra
+from aoc.inputs import map_input
+from aoc.parsers import Text, text_to_byte_grid
+from aoc.profiling import add_profile_argument, profiled, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
-Coord = Tuple[int, int]
-
-
-def build_graph(list_2d: List[List[int]]) -> Dict[Coord, Dict[Coord, int]]:
-    """
-    Build a graph from the input text.
-
-    The graph maps coordinates to neighbor coordinates and their values.
-    """
-    graph: Dict[Coord, Dict[Coord, int]] = {}
-    for y, row in enumerate(list_2d):
-        for x, _ in enumerate(row):
-            graph[(x, y)] = {}
-            if x > 0:
-                graph[(x, y)][(x - 1, y)] = int(row[x - 1])
-            if x + 1 < len(row):
-                graph[(x, y)][(x + 1, y)] = int(row[x + 1])
-            if y > 0:
-                graph[(x, y)][(x, y - 1)] = int(list_2d[y - 1][x])
-            if y + 1 < len(list_2d):
-                graph[(x, y)][(x, y + 1)] = int(list_2d[y + 1][x])
-    return graph
-
-
-def wrap_around_nine(x: int) -> int:
+load = map_input
+
+
+def wrap_around_nine(x: np.ndarray) -> np.ndarray:
     """Set values larger than 9 to x % 9."""
-    if x > 9:
-        return x % 9
-    else:
-        return x
+    return np.where(x > 9, x % 9, x)
 
 
-def extrapolate_map(list_2d: List[List[int]]) -> List[List[int]]:
+@profiled()
+def extrapolate_map(risk_map: np.ndarray) -> np.ndarray:
     """Extrapolate the map in two directions."""
-    # Extrapolate to the right
-    wide_list_2d = []
-    for row in list_2d:
-        wide_list_2d.append([wrap_around_nine(v + i) for i in range(5) for v in row])
+    # Tile i to the right and j to the bottom is raised by i + j
+    return np.block([[wrap_around_nine(risk_map + i + j) for i in range(5)] for j in range(5)])
 
-    new_list_2d = []
-    # Extrapolate to the bottom
-    for i in range(5):
-        for row in wide_list_2d:
-            new_list_2d.append([wrap_around_nine(v + i) for v in row])
-    return new_list_2d
 
-
-def solve(text: str) -> int:
+def solve(text: Text) -> int:
     """Solve the puzzle."""
-    list_2d = extrapolate_map(unspaced_text_to_2d_list(text, int))
-    graph = build_graph(list_2d)
-    _, node_costs = dijkstra(graph, (0, 0))
-    return int(node_costs[(len(list_2d[0]) - 1, len(list_2d) - 1)])
+    risk_map = extrapolate_map(text_to_byte_grid(text, "0"))
+    end = (risk_map.shape[1] - 1, risk_map.shape[0] - 1)
+    _, node_costs = grid_dijkstra(risk_map, (0, 0), targets={end})
+    return int(node_costs[-1, -1])
 
 
 INPUT_S = """\
@@ -78,7 +49,7 @@ INPUT_S = """\
 """
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, 315),),
 )
@@ -87,17 +58,17 @@ def test(input_s: str, expected: int) -> None:
     assert solve(input_s) == expected
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s"),
     ((INPUT_S),),
 )
 def test_map_extrapolation(input_s: str) -> None:
     """Check the map is correctly exptrapolated."""
-    list_2d = extrapolate_map(unspaced_text_to_2d_list(input_s, int))
-    expected_top_row = unspaced_text_to_2d_list("11637517422274862853338597396444961841755517295286", int)[0]
-    expected_bottom_row = unspaced_text_to_2d_list("67554889357866599146897761125791887223681299833479", int)[0]
-    assert list_2d[0] == expected_top_row
-    assert list_2d[-1] == expected_bottom_row
+    risk_map = extrapolate_map(text_to_byte_grid(input_s, "0"))
+    expected_top_row = text_to_byte_grid("11637517422274862853338597396444961841755517295286", "0")[0].tolist()
+    expected_bottom_row = text_to_byte_grid("67554889357866599146897761125791887223681299833479", "0")[0].tolist()
+    assert risk_map[0].tolist() == expected_top_row
+    assert risk_map[-1].tolist() == expected_bottom_row
 
 
 def main() -> int:
@@ -112,10 +83,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, load(args.data_file), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
 
     if args.submit_solution:
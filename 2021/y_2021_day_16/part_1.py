@@ -5,7 +5,9 @@ import argparse
 from dataclasses import dataclass
 from pathlib import Path
 
-import pytest
+from aoc.cache import cached_answer
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
@@ -114,7 +116,7 @@ def solve(text: str) -> int:
     return version_sum
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     (
         ("D2FE28", 6),
@@ -129,7 +131,7 @@ def test(input_s: str, expected: int) -> None:
     assert solve(input_s) == expected
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     (
         ("D2FE28", "110100101111111000101000"),
@@ -154,9 +156,14 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
 
     if args.submit_solution:
@@ -1,46 +1,32 @@
 """Day 8 part 1 solution."""
 import argparse
 from pathlib import Path
-from typing import Iterator
 
-import pytest
+import numpy as np
 
-INPUT_TXT = Path(__file__).parent / "input.txt"
-
-
-def parse(text: str) -> Iterator[list[int]]:
-    """Parse 2d array of integers."""
-    for line in text.splitlines():
-        yield [int(c) for c in line]
+from aoc.cache import cached_answer
+from aoc.parsers import text_to_byte_grid
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
+INPUT_TXT = Path(__file__).parent / "input.txt"
 
-def is_visible(x: int, y: int, row: list[int], column: list[int]) -> bool:
-    """Check if a tree is visible from any direction."""
-    if not (0 < x < len(row) and 0 < y < len(column)):
-        return True
-    height = row[x]
 
-    if (
-        max(row[:x], default=-1) >= height  # Look left
-        and max(row[x + 1 :], default=-1) >= height  # Look right
-        and max(column[:y], default=-1) >= height  # Look uo
-        and max(column[y + 1 :], default=-1) >= height  # Look down
-    ):
-        return False
-    else:
-        return True
+def visible_from_left(forest: np.ndarray) -> np.ndarray:
+    """Mark the trees that are higher than all trees to their left."""
+    tallest_before = np.full_like(forest, -1)
+    tallest_before[:, 1:] = np.maximum.accumulate(forest, axis=1)[:, :-1]
+    return forest > tallest_before
 
 
 def solve(text: str) -> int:
     """Solve the puzzle."""
-    forest = list(parse(text))
-    n_visible = 0
-    columns = {x: [row[x] for row in forest] for x in range(len(forest[0]))}
-
-    for y, row in enumerate(forest):
-        for x, column in columns.items():
-            n_visible += is_visible(x, y, row, column)
-    return n_visible
+    forest = text_to_byte_grid(text, "0").astype(int)
+    visible = np.zeros(forest.shape, dtype=bool)
+    # Look from the left, bottom, right and top by rotating the forest
+    for k in range(4):
+        visible |= np.rot90(visible_from_left(np.rot90(forest, k)), -k)
+    return int(visible.sum())
 
 
 INPUT_S = """\
@@ -53,7 +39,7 @@ INPUT_S = """\
 EXPECTED = 21
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -74,10 +60,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
 
     print(solution)
 
@@ -1,19 +1,15 @@
 """Day 8 part 2 solution."""
 import argparse
 from pathlib import Path
-from typing import Iterator
 
-import pytest
+from aoc.cache import cached_answer
+from aoc.parsers import text_to_byte_grid
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
-def parse(text: str) -> Iterator[list[int]]:
-    """Parse 2d array of integers."""
-    for line in text.splitlines():
-        yield [int(c) for c in line]
-
-
 def view(treeline: list[int], index: int, delta: int) -> int:
     """Search for distance to non-lower tree along treeline."""
     max_index = len(treeline) - 1
@@ -31,7 +27,7 @@ def view(treeline: list[int], index: int, delta: int) -> int:
 
 def solve(text: str) -> int:
     """Solve the puzzle."""
-    forest = list(parse(text))
+    forest = text_to_byte_grid(text, "0").tolist()
     columns = {x: [row[x] for row in forest] for x in range(len(forest[0]))}
 
     max_score = 0
@@ -52,7 +48,7 @@ INPUT_S = """\
 EXPECTED = 8
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -73,10 +69,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, Path(args.data_file).read_text(), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
 
     print(solution)
 
@@ -3,16 +3,20 @@ import argparse
 from pathlib import Path
 from typing import Iterator, TypeAlias
 
-import pytest
+from aoc.cache import cached_answer
+from aoc.inputs import Lines, iter_lines, read_lines
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
+load = read_lines
 
 coord: TypeAlias = tuple[int, int]  # x, y coord
 
 
-def parse(text: str) -> Iterator[tuple[str, int]]:
+def parse(text: Lines) -> Iterator[tuple[str, int]]:
     """Get direction and distance from text input."""
-    for line in text.splitlines():
+    for line in iter_lines(text):
         direction, distance = line.split()
         yield direction, int(distance)
 
@@ -48,7 +52,7 @@ def move_tail(tail_coord: coord, deltas: coord) -> coord:
     return tail_coord[0] + delta_to_distance(deltas[0]), tail_coord[1] + delta_to_distance(deltas[1])
 
 
-def solve(text: str) -> int:
+def solve(text: Lines) -> int:
     """Solve the puzzle."""
     head_coord, tail_coord = (0, 0), (0, 0)
     tail_history = {tail_coord}
@@ -74,7 +78,7 @@ R 2
 EXPECTED = 13
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -95,10 +99,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, load(args.data_file), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
 
     if args.submit_solution:
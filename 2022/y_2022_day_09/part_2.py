@@ -3,16 +3,20 @@ import argparse
 from pathlib import Path
 from typing import Iterator, TypeAlias
 
-import pytest
+from aoc.cache import cached_answer
+from aoc.inputs import Lines, iter_lines, read_lines
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
+load = read_lines
 
 coord: TypeAlias = tuple[int, int]  # x, y coord
 
 
-def parse(text: str) -> Iterator[tuple[str, int]]:
+def parse(text: Lines) -> Iterator[tuple[str, int]]:
     """Get direction and distance from text input."""
-    for line in text.splitlines():
+    for line in iter_lines(text):
         direction, distance = line.split()
         yield direction, int(distance)
 
@@ -61,7 +65,7 @@ def move_rope(rope: list[coord], direction: str) -> Iterator[coord]:
             yield previous_knot
 
 
-def solve(text: str) -> int:
+def solve(text: Lines) -> int:
     """Solve the puzzle."""
     rope: list[coord] = [(0, 0) for _ in range(10)]
     tail_history = {rope[-1]}
@@ -97,7 +101,7 @@ U 20
 EXPECTED_2 = 36
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S_1, EXPECTED_1), (INPUT_S_2, EXPECTED_2)),
 )
@@ -118,10 +122,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, load(args.data_file), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
 
     if args.submit_solution:
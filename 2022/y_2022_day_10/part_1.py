@@ -2,18 +2,22 @@
 import argparse
 from pathlib import Path
 
-import pytest
+from aoc.cache import cached_answer
+from aoc.inputs import Lines, iter_lines, read_lines
+from aoc.profiling import add_profile_argument, solve_profiled
+from aoc.testing import parametrize
 
 INPUT_TXT = Path(__file__).parent / "input.txt"
+load = read_lines
 
 
-def solve(text: str) -> int:
+def solve(text: Lines) -> int:
     """Solve the puzzle."""
     cycles_to_check = [20, 60, 100, 140, 180, 220]
     signal_strength = 0
     cycle = 0
     x = 1
-    for line in text.splitlines():
+    for line in iter_lines(text):
         if line == "noop":
             cycle += 1
             if cycle in cycles_to_check:
@@ -181,7 +185,7 @@ noop
 EXPECTED = 13140
 
 
-@pytest.mark.parametrize(
+@parametrize(
     ("input_s", "expected"),
     ((INPUT_S, EXPECTED),),
 )
@@ -202,10 +206,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, load(args.data_file), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     print(solution)
 
     if args.submit_solution:
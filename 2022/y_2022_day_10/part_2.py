@@ -3,7 +3,12 @@ import argparse
 import textwrap
 from pathlib import Path
 
+from aoc.cache import cached_answer
+from aoc.inputs import Lines, iter_lines, read_lines
+from aoc.profiling import add_profile_argument, solve_profiled
+
 INPUT_TXT = Path(__file__).parent / "input.txt"
+load = read_lines
 
 
 def draw_pixel(x: int, cycle: int) -> str:
@@ -14,12 +19,12 @@ def draw_pixel(x: int, cycle: int) -> str:
         return "."
 
 
-def solve(text: str) -> str:
+def solve(text: Lines) -> str:
     """Solve the puzzle."""
     cycle = 0
     x = 1
     output = ""
-    for line in text.splitlines():
+    for line in iter_lines(text):
         if line == "noop":
             output += draw_pixel(x, cycle)
             cycle += 1
@@ -46,10 +51,15 @@ def main() -> int:
         const=True,
         default=False,
     )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    with open(args.data_file) as f:
-        solution = solve(f.read())
+    solution = cached_answer(
+        lambda: solve_profiled(solve, load(args.data_file), args.profile),
+        __file__,
+        args.data_file,
+        use_cache=args.submit_solution,
+    )
     # solution = solve(INPUT_S)
     print(solution)
 
@@ -1,2 +1,34 @@
 """Advent of code helper functions."""
+import importlib
+from types import ModuleType
+from typing import List
+
 __version__ = "0.1.0"
+
+# Submodules are imported on first attribute access, so importing aoc does not load e.g. NumPy (PEP 562)
+SUBMODULES = (
+    "automaton",
+    "cache",
+    "cli",
+    "compute",
+    "gen",
+    "inputs",
+    "number_theory",
+    "parallel",
+    "parsers",
+    "profiling",
+    "serve",
+    "testing",
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a submodule when it is accessed as an attribute of the package."""
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the submodules next to the attributes that are already set."""
+    return sorted(set(globals()) | set(SUBMODULES))
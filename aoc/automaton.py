@@ -0,0 +1,200 @@
+"""Cellular automata on an infinite grid, e.g. the game of life, with pluggable rules and neighbourhoods.
+
+SparseAutomaton keeps the live cells as a set of packed integer keys. A coordinate (x, y, ...) is packed as
+x + y * STRIDE + ..., which is linear, so the key of a neighbour is the key of the cell plus the packed offset. Every
+generation counts the live neighbours of all cells with one Counter pass over the live cells per offset.
+
+DenseAutomaton keeps a boolean array around the live cells instead, which is faster when the live cells fill a good
+part of their bounding box. Its neighbour counts are sums of shifted slices of the array, one per offset.
+"""
+import itertools
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import AbstractSet, Iterable, Iterator, List, Sequence, Set, Tuple
+
+import numpy as np
+
+Coord = Tuple[int, ...]
+# Every coordinate must stay within +-STRIDE // 2 for keys to be unique
+STRIDE = 1 << 20
+# Offsets of the six neighbours of a hexagon in axial coordinates, i.e. cube coordinates without the last one
+HEX = ((1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1))
+
+
+def moore(dimensions: int = 2) -> List[Coord]:
+    """Return the offsets of the neighbours that share a face, edge or corner with a cell."""
+    return [offset for offset in itertools.product((-1, 0, 1), repeat=dimensions) if any(offset)]
+
+
+def von_neumann(dimensions: int = 2) -> List[Coord]:
+    """Return the offsets of the neighbours that share a face with a cell."""
+    return [offset for offset in moore(dimensions) if sum(map(abs, offset)) == 1]
+
+
+def pack(coord: Sequence[int]) -> int:
+    """Pack a coordinate into an integer key."""
+    key = 0
+    for value in reversed(coord):
+        key = key * STRIDE + value
+    return key
+
+
+def unpack(key: int, dimensions: int = 2) -> Coord:
+    """Unpack an integer key into a coordinate of the given number of dimensions."""
+    coord = []
+    for _ in range(dimensions):
+        value = (key + STRIDE // 2) % STRIDE - STRIDE // 2
+        coord.append(value)
+        key = (key - value) // STRIDE
+    return tuple(coord)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Numbers of live neighbours for which a dead cell comes alive and a live cell stays alive."""
+
+    birth: AbstractSet[int]
+    survival: AbstractSet[int]
+
+    def __post_init__(self) -> None:
+        """Check that the rule keeps the number of live cells finite."""
+        if 0 in self.birth:
+            raise ValueError("A birth rule with 0 neighbours brings infinitely many cells alive")
+
+
+LIFE = Rule(frozenset({3}), frozenset({2, 3}))
+
+
+@dataclass
+class SparseAutomaton:
+    """A set of live cells that evolves by a rule, for patterns that are small compared to the area they span."""
+
+    live: Set[int]
+    neighbourhood: Sequence[Coord]
+    rule: Rule
+    generation: int = 0
+    _offsets: List[int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Pack the neighbourhood."""
+        self._offsets = [pack(offset) for offset in self.neighbourhood]
+
+    @classmethod
+    def from_cells(
+        cls, cells: Iterable[Sequence[int]], neighbourhood: Sequence[Coord], rule: Rule
+    ) -> "SparseAutomaton":
+        """Create an automaton from the coordinates of the live cells."""
+        return cls({pack(cell) for cell in cells}, neighbourhood, rule)
+
+    def __len__(self) -> int:
+        """Return the number of live cells."""
+        return len(self.live)
+
+    def cells(self) -> Iterator[Coord]:
+        """Yield the coordinates of the live cells."""
+        dimensions = len(self.neighbourhood[0])
+        return (unpack(key, dimensions) for key in self.live)
+
+    def step(self) -> None:
+        """Advance one generation."""
+        live = self.live
+        counts: Counter = Counter()
+        for offset in self._offsets:
+            counts.update(map(offset.__add__, live))
+        birth, survival = self.rule.birth, self.rule.survival
+        self.live = {key for key, count in counts.items() if (count in survival if key in live else count in birth)}
+        if 0 in survival:
+            # Cells without live neighbours are not counted at all
+            self.live.update(live - counts.keys())
+        self.generation += 1
+
+    def run(self, generations: int) -> "SparseAutomaton":
+        """Advance the given number of generations and return the automaton."""
+        for _ in range(generations):
+            self.step()
+        return self
+
+
+def count_neighbours(grid: np.ndarray, neighbourhood: Sequence[Coord]) -> np.ndarray:
+    """
+    Count the live neighbours of every cell of a boolean or 0/1 array, cells outside the array count as dead.
+
+    Offsets are (x, y, ...) like coordinates, so their first value shifts along the last axis of the array.
+    """
+    counts = np.zeros(grid.shape, dtype=np.uint8)
+    for offset in neighbourhood:
+        # The count of the cell at index i is increased by the cell at index i + offset
+        target = tuple(slice(max(-shift, 0), size - max(shift, 0)) for shift, size in zip(offset[::-1], grid.shape))
+        source = tuple(slice(max(shift, 0), size - max(-shift, 0)) for shift, size in zip(offset[::-1], grid.shape))
+        counts[target] += grid[source]
+    return counts
+
+
+@dataclass
+class DenseAutomaton:
+    """
+    A boolean array of cells that evolves by a rule, for patterns that fill a good part of their bounding box.
+
+    The array keeps a border of dead cells as wide as the neighbourhood reaches, so no cell outside of it can come
+    alive. When live cells get into the border, the array grows on that side by a quarter of its size.
+    """
+
+    grid: np.ndarray
+    origin: Coord
+    neighbourhood: Sequence[Coord]
+    rule: Rule
+    generation: int = 0
+    _birth: np.ndarray = field(init=False, repr=False)
+    _survival: np.ndarray = field(init=False, repr=False)
+    _reach: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build lookup tables of the rule by neighbour count and make room for the first generation."""
+        self._birth = np.isin(np.arange(len(self.neighbourhood) + 1), list(self.rule.birth))
+        self._survival = np.isin(np.arange(len(self.neighbourhood) + 1), list(self.rule.survival))
+        self._reach = max(abs(shift) for offset in self.neighbourhood for shift in offset)
+        self._grow()
+
+    @classmethod
+    def from_cells(cls, cells: Iterable[Sequence[int]], neighbourhood: Sequence[Coord], rule: Rule) -> "DenseAutomaton":
+        """Create an automaton from the coordinates of the live cells."""
+        indices = np.array([tuple(cell)[::-1] for cell in cells], dtype=np.int64).reshape(-1, len(neighbourhood[0]))
+        low = indices.min(axis=0) if len(indices) else np.zeros(indices.shape[1], dtype=np.int64)
+        high = indices.max(axis=0) if len(indices) else low
+        grid = np.zeros(high - low + 1, dtype=bool)
+        grid[tuple((indices - low).T)] = True
+        return cls(grid, tuple(low[::-1].tolist()), neighbourhood, rule)
+
+    def __len__(self) -> int:
+        """Return the number of live cells."""
+        return int(np.count_nonzero(self.grid))
+
+    def cells(self) -> Iterator[Coord]:
+        """Yield the coordinates of the live cells."""
+        origin = np.array(self.origin[::-1])
+        return (tuple(index[::-1]) for index in (np.argwhere(self.grid) + origin).tolist())
+
+    def _grow(self) -> None:
+        """Pad the sides of the grid where live cells are within reach of the edge."""
+        reach = self._reach
+        pad_widths = []
+        for axis, size in enumerate(self.grid.shape):
+            lines = np.moveaxis(self.grid, axis, 0)
+            margin = max(reach, size // 4)
+            pad_widths.append((margin if lines[:reach].any() else 0, margin if lines[size - reach :].any() else 0))
+        if any(any(widths) for widths in pad_widths):
+            self.grid = np.pad(self.grid, pad_widths)
+            self.origin = tuple(value - widths[0] for value, widths in zip(self.origin, reversed(pad_widths)))
+
+    def step(self) -> None:
+        """Advance one generation."""
+        counts = count_neighbours(self.grid, self.neighbourhood)
+        self.grid = np.where(self.grid, self._survival[counts], self._birth[counts])
+        self._grow()
+        self.generation += 1
+
+    def run(self, generations: int) -> "DenseAutomaton":
+        """Advance the given number of generations and return the automaton."""
+        for _ in range(generations):
+            self.step()
+        return self
@@ -0,0 +1,119 @@
+"""Cache answers on disk, keyed by the hash of the input and of the source code of the solution.
+
+Every answer is a small JSON file in the cache directory. Reading an entry touches it, so the modification times
+order the entries from least to most recently used and the oldest are removed once the directory grows too large.
+"""
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "aoc"
+PACKAGE_DIR = Path(__file__).parent
+PathLike = Union[str, Path]
+# Inputs are hashed in chunks of this many bytes, so hashing a large input does not load it into memory
+CHUNK_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=None)
+def _package_digest() -> str:
+    """Hash the source of the aoc package, the solutions depend on its helpers."""
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIR.rglob("*.py")):
+        digest.update(path.relative_to(PACKAGE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _file_digest(path: PathLike) -> bytes:
+    """Hash a file one chunk at a time."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def cache_key(solver_path: PathLike, input_path: PathLike) -> str:
+    """Return the key of the answer of a solution on an input, it changes whenever either file or aoc changes."""
+    digest = hashlib.sha256()
+    for path in (solver_path, input_path):
+        digest.update(_file_digest(path))
+    digest.update(_package_digest().encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class AnswerCache:
+    """A directory of answers that is kept below max_bytes by removing the least recently used ones."""
+
+    directory: Path = field(default_factory=lambda: CACHE_DIR)
+    max_bytes: int = 10 * 1024**2
+
+    def _path(self, key: str) -> Path:
+        """Return the file of an entry."""
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry, or None when there is none or it can not be read."""
+        path = self._path(key)
+        try:
+            entry: Dict[str, Any] = json.loads(path.read_text())
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def put(self, key: str, answer: str, seconds: float = 0.0) -> None:
+        """Store an answer and how long it took to compute, then evict entries when the cache is too large."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so processes that read at the same time never see half an entry
+        with tempfile.NamedTemporaryFile("w", dir=self.directory, suffix=".tmp", delete=False) as f:
+            json.dump({"answer": answer, "seconds": seconds}, f)
+        os.replace(f.name, self._path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def cached_answer(
+    compute: Callable[[], Any],
+    solver_path: PathLike,
+    input_path: PathLike,
+    use_cache: bool = True,
+    cache: Optional[AnswerCache] = None,
+) -> Any:
+    """
+    Return the cached answer of a solution on an input, or compute it and store it as a string.
+
+    With use_cache False the answer is computed without hashing anything, so the cache costs nothing.
+    """
+    if not use_cache:
+        return compute()
+    cache = cache or AnswerCache()
+    key = cache_key(solver_path, input_path)
+    entry = cache.get(key)
+    if entry is not None:
+        return entry["answer"]
+    answer = compute()
+    if answer is not None:
+        cache.put(key, str(answer))
+    return answer
@@ -0,0 +1,398 @@
+"""Discover and run the solutions of every year, day and part, in a single process or over a process per part.
+
+Run from the repo root:
+aoc run --year 2021 --day 9 15
+aoc run --jobs 4 --timeout 60 --memory-limit 2000 --durations results.json --json results.json
+aoc run --no-cache
+aoc serve & aoc run --day 9 --part 2 --server
+"""
+import argparse
+import importlib.util
+import itertools
+import json
+import math
+import multiprocessing
+import re
+import resource
+import signal
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from aoc.cache import CACHE_DIR, AnswerCache, cache_key
+
+PART_PATTERN = re.compile(r"(?P<year>\d{4})/y_(?P=year)_day_(?P<day>\d{2})/part_(?P<part>\d)\.py$")
+# Seconds per (year, day, part) of the parts that took over half a second in a full run, so they start first
+# even when no earlier run recorded durations
+KNOWN_DURATIONS = {
+    (2022, 11, 2): 7.1,
+    (2021, 15, 2): 2.3,
+    (2021, 12, 2): 2.2,
+    (2021, 9, 2): 1.3,
+    (2021, 5, 2): 0.7,
+    (2022, 9, 2): 0.6,
+}
+# Parts without a known duration are scheduled as if they took this long
+UNKNOWN_SECONDS = 0.5
+# Every run records its durations here, below the cache directory but out of the way of the cached answers
+DURATIONS_FILE = Path("durations", "durations.json")
+
+
+@dataclass(frozen=True)
+class Task:
+    """A part of a puzzle solution and the input it is run on."""
+
+    year: int
+    day: int
+    part: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        """Return a name that is unique over all tasks, also used as module name."""
+        return f"y_{self.year}_day_{self.day:02}_part_{self.part}"
+
+    @property
+    def input_path(self) -> Path:
+        """Return the input of the day."""
+        return self.path.with_name("input.txt")
+
+
+@dataclass
+class Result:
+    """The answer of a task or the error it raised, and how long solve took in seconds, when it was first solved."""
+
+    task: Task
+    answer: Optional[str] = None
+    seconds: float = 0.0
+    error: Optional[str] = None
+    cached: bool = False
+    timed_out: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a JSON serializable dict."""
+        return {
+            "year": self.task.year,
+            "day": self.task.day,
+            "part": self.task.part,
+            "answer": self.answer,
+            "seconds": self.seconds,
+            "error": self.error,
+            "cached": self.cached,
+        }
+
+
+@dataclass
+class _Running:
+    """A task that is being solved in a child process, with the end of the pipe its result comes from."""
+
+    task: Task
+    process: BaseProcess
+    connection: Connection
+    start: float
+
+
+def discover(
+    root: Path,
+    years: Optional[Collection[int]] = None,
+    days: Optional[Collection[int]] = None,
+    parts: Optional[Collection[int]] = None,
+) -> List[Task]:
+    """Find the YYYY/y_YYYY_day_NN/part_N.py files under root, optionally only the given years, days and parts."""
+    tasks = []
+    for path in root.glob("[0-9][0-9][0-9][0-9]/y_*_day_*/part_*.py"):
+        match = PART_PATTERN.search(path.relative_to(root).as_posix())
+        if match is None:
+            continue
+        task = Task(int(match["year"]), int(match["day"]), int(match["part"]), path)
+        if (
+            (years is None or task.year in years)
+            and (days is None or task.day in days)
+            and (parts is None or task.part in parts)
+        ):
+            tasks.append(task)
+    return sorted(tasks, key=lambda task: (task.year, task.day, task.part))
+
+
+def load_solver(task: Task) -> ModuleType:
+    """Import the part file of a task as a module."""
+    spec = importlib.util.spec_from_file_location(task.name, task.path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Can not import {task.path}")
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses and pickling look the module up by name
+    sys.modules[task.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_text(path: Path) -> str:
+    """Read an input as a str, the loader of part files that do not define their own."""
+    return path.read_text()
+
+
+def run_task(task: Task, module: Optional[ModuleType] = None, input_path: Optional[Path] = None) -> Result:
+    """
+    Call the solve function of a task on its input and time it, errors are stored in the result.
+
+    The part file is imported unless its module is given, the input defaults to the input.txt of the day. A part file
+    can define load(path) to pass its input to solve differently, e.g. streamed with read_lines or mapped with
+    map_input. Such lazy loaders read the input while solve runs, so that time is included.
+    """
+    try:
+        module = module or load_solver(task)
+        load = getattr(module, "load", read_text)
+        data = load(input_path or task.input_path)
+        start = time.perf_counter()
+        answer: Any = module.solve(data)
+        return Result(task, str(answer), time.perf_counter() - start)
+    except Exception as error:
+        return Result(task, error=f"{type(error).__name__}: {error}")
+
+
+def format_result(result: Result) -> str:
+    """Format a result as a table row, answers over several lines continue on indented rows."""
+    task = result.task
+    answer = result.answer if result.error is None else f"ERROR {result.error}"
+    first_line, *other_lines = str(answer).splitlines() or [""]
+    cached = " (cached)" if result.cached else ""
+    rows = [f"{task.year:>4} {task.day:>3} {task.part:>4} {result.seconds:>9.3f}  {first_line}{cached}"]
+    rows += [f"{'':>24}{line}" for line in other_lines]
+    return "\n".join(rows)
+
+
+def _run_in_child(task: Task, memory_limit: Optional[int], connection: Connection) -> None:
+    """Run a task in a child process and send back the result, memory_limit is in MB of address space."""
+    if memory_limit is not None:
+        limit = memory_limit * 1024**2
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    connection.send(run_task(task))
+    connection.close()
+
+
+def _start(task: Task, memory_limit: Optional[int]) -> _Running:
+    """Start solving a task in a new process."""
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_run_in_child, args=(task, memory_limit, sender), daemon=True)
+    process.start()
+    # Only the child writes, closing our copy makes recv fail instead of hang when the child dies
+    sender.close()
+    return _Running(task, process, receiver, time.perf_counter())
+
+
+def _finish(running: _Running, error: Optional[str] = None, timed_out: bool = False) -> Result:
+    """Collect the result of a task, or kill its process and report the error."""
+    if error is None:
+        try:
+            result: Result = running.connection.recv()
+        except EOFError:
+            running.process.join()
+            error = f"Process exited with code {running.process.exitcode}"
+    if error is not None:
+        running.process.kill()
+        result = Result(running.task, seconds=time.perf_counter() - running.start, error=error, timed_out=timed_out)
+    running.process.join()
+    running.connection.close()
+    return result
+
+
+def run_parallel(
+    tasks: Iterable[Task], jobs: int, timeout: Optional[float] = None, memory_limit: Optional[int] = None
+) -> Iterator[Result]:
+    """
+    Solve every task in its own process, at most jobs at a time, and yield the results as they finish.
+
+    Tasks are started in the given order. A task that takes longer than timeout seconds is killed and one that
+    needs more than memory_limit MB fails, both end up as errors in the results.
+    """
+    queue = deque(tasks)
+    running: Dict[Connection, _Running] = {}
+    try:
+        while queue or running:
+            while queue and len(running) < jobs:
+                started = _start(queue.popleft(), memory_limit)
+                running[started.connection] = started
+            wait_time = None
+            if timeout is not None:
+                first_deadline = min(started.start for started in running.values()) + timeout
+                wait_time = max(0.0, first_deadline - time.perf_counter())
+            for connection in wait(list(running), wait_time):
+                yield _finish(running.pop(connection))  # type: ignore[call-overload]
+            for connection, started in list(running.items()):
+                if timeout is not None and time.perf_counter() - started.start > timeout:
+                    yield _finish(running.pop(connection), f"Timeout after {timeout} s", timed_out=True)
+    finally:
+        for started in running.values():
+            _finish(started, "Cancelled")
+
+
+def load_durations(path: Path) -> Dict[Tuple[int, int, int], float]:
+    """Read the solve time per (year, day, part) from a JSON file written by a previous run."""
+    with open(path) as f:
+        return {(result["year"], result["day"], result["part"]): result["seconds"] for result in json.load(f)}
+
+
+def save_durations(path: Path, results: Iterable[Result]) -> None:
+    """
+    Add the solve times of the results to a durations file, the parts that did not run keep their time.
+
+    Cached answers and errors are left out, errors take 0 seconds however slow the part is. A timeout is kept when it
+    took longer than the recorded time, since the part takes at least that long.
+    """
+    try:
+        durations = load_durations(path)
+    except (OSError, ValueError, KeyError, TypeError):
+        durations = {}
+    for result in results:
+        key = (result.task.year, result.task.day, result.task.part)
+        if result.timed_out:
+            durations[key] = max(durations.get(key, 0.0), result.seconds)
+        elif not result.cached and result.error is None:
+            durations[key] = result.seconds
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entries = [
+        {"year": year, "day": day, "part": part, "seconds": durations[year, day, part]}
+        for year, day, part in sorted(durations)
+    ]
+    path.write_text(json.dumps(entries, indent=2) + "\n")
+
+
+def slowest_first(
+    tasks: Iterable[Task], durations: Dict[Tuple[int, int, int], float], unknown: float = math.inf
+) -> List[Task]:
+    """Order tasks by their previous duration, the ones without a duration count as taking unknown seconds."""
+    return sorted(tasks, key=lambda task: -durations.get((task.year, task.day, task.part), unknown))
+
+
+def lookup_cached(tasks: Iterable[Task], cache: AnswerCache) -> Tuple[List[Result], Dict[Task, str]]:
+    """Return the results of the tasks with a cached answer and the cache key of every other task."""
+    hits = []
+    keys = {}
+    for task in tasks:
+        try:
+            key = cache_key(task.path, task.input_path)
+        except OSError:
+            # Without an input there is nothing to look up, solving reports the missing file
+            continue
+        entry = cache.get(key)
+        if entry is None:
+            keys[task] = key
+        else:
+            hits.append(Result(task, entry["answer"], entry["seconds"], cached=True))
+    return hits, keys
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the selected tasks and print a table of answers, answers in the cache are not solved again."""
+    tasks = discover(args.root, args.year, args.day, args.part)
+    cache_dir = args.cache_dir or CACHE_DIR
+    cache = None if args.no_cache else AnswerCache(cache_dir)
+    hits: List[Result] = []
+    keys: Dict[Task, str] = {}
+    if cache is not None:
+        hits, keys = lookup_cached(tasks, cache)
+        solved = {result.task for result in hits}
+        tasks_to_run = [task for task in tasks if task not in solved]
+    else:
+        tasks_to_run = tasks
+    # Without durations of an earlier run, the parts known to be slow still start first
+    durations = dict(KNOWN_DURATIONS)
+    durations_path = args.durations or cache_dir / DURATIONS_FILE
+    if durations_path.exists():
+        durations.update(load_durations(durations_path))
+    tasks_to_run = slowest_first(tasks_to_run, durations, UNKNOWN_SECONDS)
+    if args.server is not None:
+        # aoc.serve imports this module
+        from aoc.serve import SOCKET_PATH, solve_remote
+
+        results: Iterator[Result] = solve_remote(tasks_to_run, Path(args.server) if args.server else SOCKET_PATH)
+    elif args.jobs is None and args.timeout is None and args.memory_limit is None:
+        results = map(run_task, tasks_to_run)
+    else:
+        results = run_parallel(tasks_to_run, args.jobs or multiprocessing.cpu_count(), args.timeout, args.memory_limit)
+
+    print(f"{'year':>4} {'day':>3} {'part':>4} {'seconds':>9}  answer")
+    collected = []
+    start = time.perf_counter()
+    for result in itertools.chain(hits, results):
+        collected.append(result)
+        print(format_result(result), flush=True)
+        if cache is not None and result.task in keys and result.error is None and result.answer is not None:
+            cache.put(keys[result.task], result.answer, result.seconds)
+    n_errors = sum(result.error is not None for result in collected)
+    print(f"{len(tasks)} parts in {time.perf_counter() - start:.3f} s, {n_errors} errors")
+    save_durations(cache_dir / DURATIONS_FILE, collected)
+
+    if args.json is not None:
+        collected.sort(key=lambda result: (result.task.year, result.task.day, result.task.part))
+        args.json.write_text(json.dumps([result.to_dict() for result in collected], indent=2) + "\n")
+    return int(n_errors > 0)
+
+
+def serve(args: argparse.Namespace) -> int:
+    """Keep the solutions loaded and solve the tasks sent by aoc run --server."""
+    # aoc.serve imports this module
+    from aoc.serve import SOCKET_PATH
+    from aoc.serve import serve as serve_forever
+
+    # Exit through the finally blocks that remove the socket, also when stopped with kill
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        serve_forever(args.root, args.socket or SOCKET_PATH)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def add_filter_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that select which tasks to run."""
+    parser.add_argument("--root", type=Path, default=Path.cwd(), help="folder that contains the year folders")
+    parser.add_argument("-y", "--year", type=int, nargs="+", help="only run these years")
+    parser.add_argument("-d", "--day", type=int, nargs="+", help="only run these days")
+    parser.add_argument("-p", "--part", type=int, nargs="+", help="only run these parts")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the aoc command line interface."""
+    parser = argparse.ArgumentParser(prog="aoc", description="Run advent of code solutions.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run solutions and print their answers and timings")
+    add_filter_arguments(run_parser)
+    run_parser.add_argument("-j", "--jobs", type=int, help="solve each part in its own process, this many at a time")
+    run_parser.add_argument("--timeout", type=float, help="seconds after which a part is killed, implies processes")
+    run_parser.add_argument("--memory-limit", type=int, help="MB of memory a part may use, implies processes")
+    run_parser.add_argument(
+        "--durations",
+        type=Path,
+        help="JSON results of an earlier run, slow parts start first, defaults to the durations of the last run",
+    )
+    run_parser.add_argument("--json", type=Path, help="write the results to this JSON file")
+    run_parser.add_argument("--cache-dir", type=Path, help=f"directory of cached answers, defaults to {CACHE_DIR}")
+    run_parser.add_argument("--no-cache", action="store_true", help="solve every part, even if its answer is cached")
+    run_parser.add_argument(
+        "--server",
+        nargs="?",
+        const="",
+        metavar="SOCKET",
+        help="solve in the warm process of aoc serve, optionally on another socket than the default one",
+    )
+    run_parser.set_defaults(func=run)
+
+    serve_parser = subparsers.add_parser("serve", help="keep the solutions loaded and solve what aoc run sends")
+    serve_parser.add_argument("--root", type=Path, default=Path.cwd(), help="folder that contains the year folders")
+    serve_parser.add_argument("--socket", type=Path, help="Unix socket to listen on")
+    serve_parser.set_defaults(func=serve)
+
+    args = parser.parse_args(argv)
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    exit(main())
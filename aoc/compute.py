@@ -1,34 +1,262 @@
 """Re-usable compute functions."""
 import heapq as heap
-from collections import defaultdict
-from typing import Dict, List, Tuple, Union
+import itertools
+from array import array
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Callable, Collection, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from aoc.profiling import profiled
 
 Coord = Tuple[int, int]
+Heuristic = Callable[[Coord, Coord], int]
+# Either an adjacency dict or a callback that generates (neighbor, weight) pairs on demand
+Neighbors = Callable[[Coord], Iterable[Tuple[Coord, int]]]
+Graph = Union[Dict[Coord, Dict[Coord, int]], Neighbors]
+UnweightedGraph = Union[Mapping[Coord, Iterable[Coord]], Callable[[Coord], Iterable[Coord]]]
+UNREACHED = -1
+
+
+# Writes are tracked per page of memory so a snapshot can be restored by copying back only changed pages
+INTCODE_PAGE_BITS = 6
+# Number of parameters per intcode opcode
+INTCODE_ARITY = {1: 3, 2: 3, 3: 1, 4: 1, 5: 2, 6: 2, 7: 3, 8: 3, 9: 1, 99: 0}
+
+
+def _decode_instructions() -> Dict[int, Tuple[int, Tuple[int, int, int]]]:
+    """Decode every valid intcode instruction word into its opcode and parameter modes."""
+    decoded = {}
+    for opcode, arity in INTCODE_ARITY.items():
+        for mode_1, mode_2, mode_3 in itertools.product(range(3), repeat=3):
+            # Parameters that are not used can not have a mode
+            if any((mode_1, mode_2, mode_3)[arity:]):
+                continue
+            word = opcode + 100 * mode_1 + 1_000 * mode_2 + 10_000 * mode_3
+            decoded[word] = (opcode, (mode_1, mode_2, mode_3))
+    return decoded
+
+
+INTCODE_INSTRUCTIONS = _decode_instructions()
+
+
+@dataclass(frozen=True)
+class IntcodeSnapshot:
+    """Saved state of an intcode VM, see IntcodeVM.snapshot."""
+
+    memory: array
+    ip: int
+    relative_base: int
+    inputs: Tuple[int, ...]
+    outputs: Tuple[int, ...]
+    halted: bool
+    waiting_for_input: bool
+
+
+class IntcodeVM:
+    """
+    Intcode computer with position, immediate and relative parameter modes.
+
+    Memory is an array('q') copy of the program that grows with zeros when an address past its end is used,
+    so values are limited to signed 64 bit integers. Instruction words are looked up in a table that is
+    decoded once for all instances, instead of splitting the word into opcode and modes on every step.
+
+    When the program needs input and none is queued, run returns with waiting_for_input set.
+    Queue more inputs and call run again to resume. The full state can be saved with snapshot and
+    brought back with restore, which is cheap for the latest snapshot since only written pages are copied.
+    """
+
+    def __init__(self, code: Iterable[int], inputs: Iterable[int] = ()):
+        self.memory = array("q", code)
+        self.ip = 0
+        self.relative_base = 0
+        self.inputs = deque(inputs)
+        self.outputs: List[int] = []
+        self.halted = False
+        self.waiting_for_input = False
+        self.n_instructions = 0
+        self._dirty_pages: Set[int] = set()
+        self._base_snapshot: Optional[IntcodeSnapshot] = None
+        handlers: Dict[int, Callable[[Tuple[int, int, int]], None]] = {
+            1: self._add,
+            2: self._multiply,
+            3: self._input,
+            4: self._output,
+            5: self._jump_if_true,
+            6: self._jump_if_false,
+            7: self._less_than,
+            8: self._equals,
+            9: self._adjust_relative_base,
+            99: self._halt,
+        }
+        # Instruction word -> bound handler and parameter modes
+        self._dispatch = {word: (handlers[opcode], modes) for word, (opcode, modes) in INTCODE_INSTRUCTIONS.items()}
+
+    def _grow(self, address: int) -> None:
+        """Extend memory with zeros so that the address is valid."""
+        new_size = max(address + 1, 2 * len(self.memory))
+        self.memory.frombytes(bytes(self.memory.itemsize * (new_size - len(self.memory))))
+
+    def _address(self, offset: int, mode: int) -> int:
+        """Get the memory address of the parameter at ip + offset."""
+        if mode == 1:
+            address = self.ip + offset
+        elif mode == 2:
+            address = self.relative_base + self.memory[self.ip + offset]
+        else:
+            address = self.memory[self.ip + offset]
+        if address >= len(self.memory):
+            self._grow(address)
+        elif address < 0:
+            # An array index from the end would silently use the wrong value
+            raise ValueError(f"Negative intcode address {address} at address {self.ip}")
+        return address
+
+    def _add(self, modes: Tuple[int, int, int]) -> None:
+        memory = self.memory
+        self.write(self._address(3, modes[2]), memory[self._address(1, modes[0])] + memory[self._address(2, modes[1])])
+        self.ip += 4
+
+    def _multiply(self, modes: Tuple[int, int, int]) -> None:
+        memory = self.memory
+        self.write(self._address(3, modes[2]), memory[self._address(1, modes[0])] * memory[self._address(2, modes[1])])
+        self.ip += 4
+
+    def _input(self, modes: Tuple[int, int, int]) -> None:
+        if not self.inputs:
+            self.waiting_for_input = True
+            return
+        self.write(self._address(1, modes[0]), self.inputs.popleft())
+        self.ip += 2
 
+    def _output(self, modes: Tuple[int, int, int]) -> None:
+        self.outputs.append(self.memory[self._address(1, modes[0])])
+        self.ip += 2
 
-def run_intcode(code: List[int]) -> List[int]:
-    """Run intcode program with addition an multiplication."""
-    index = 0
-    while code[index] != 99:
-        opcode = code[index]
-        if opcode == 1:
-            code[code[index + 3]] = code[code[index + 1]] + code[code[index + 2]]
-        elif opcode == 2:
-            code[code[index + 3]] = code[code[index + 1]] * code[code[index + 2]]
-        index += 4
-    return code
+    def _jump_if_true(self, modes: Tuple[int, int, int]) -> None:
+        if self.memory[self._address(1, modes[0])]:
+            self.ip = self.memory[self._address(2, modes[1])]
+        else:
+            self.ip += 3
 
+    def _jump_if_false(self, modes: Tuple[int, int, int]) -> None:
+        if self.memory[self._address(1, modes[0])]:
+            self.ip += 3
+        else:
+            self.ip = self.memory[self._address(2, modes[1])]
 
+    def _less_than(self, modes: Tuple[int, int, int]) -> None:
+        memory = self.memory
+        self.write(self._address(3, modes[2]), memory[self._address(1, modes[0])] < memory[self._address(2, modes[1])])
+        self.ip += 4
+
+    def _equals(self, modes: Tuple[int, int, int]) -> None:
+        memory = self.memory
+        self.write(self._address(3, modes[2]), memory[self._address(1, modes[0])] == memory[self._address(2, modes[1])])
+        self.ip += 4
+
+    def _adjust_relative_base(self, modes: Tuple[int, int, int]) -> None:
+        self.relative_base += self.memory[self._address(1, modes[0])]
+        self.ip += 2
+
+    def _halt(self, modes: Tuple[int, int, int]) -> None:
+        self.halted = True
+
+    def write(self, address: int, value: int) -> None:
+        """Write a value to memory and remember its page was changed."""
+        if address >= len(self.memory):
+            self._grow(address)
+        elif address < 0:
+            raise ValueError(f"Negative intcode address {address}")
+        self.memory[address] = value
+        self._dirty_pages.add(address >> INTCODE_PAGE_BITS)
+
+    def snapshot(self) -> IntcodeSnapshot:
+        """Save the current state, page tracking restarts from this snapshot."""
+        snapshot = IntcodeSnapshot(
+            array("q", self.memory),
+            self.ip,
+            self.relative_base,
+            tuple(self.inputs),
+            tuple(self.outputs),
+            self.halted,
+            self.waiting_for_input,
+        )
+        self._base_snapshot = snapshot
+        self._dirty_pages.clear()
+        return snapshot
+
+    def restore(self, snapshot: IntcodeSnapshot) -> None:
+        """Bring back a saved state, only the pages written since are copied when it is the latest snapshot."""
+        if snapshot is self._base_snapshot:
+            page_size = 1 << INTCODE_PAGE_BITS
+            # Memory only grows, drop whatever was added after the snapshot
+            del self.memory[len(snapshot.memory) :]
+            for page in self._dirty_pages:
+                start = page << INTCODE_PAGE_BITS
+                self.memory[start : start + page_size] = snapshot.memory[start : start + page_size]
+        else:
+            self.memory[:] = snapshot.memory
+            self._base_snapshot = snapshot
+        self._dirty_pages.clear()
+        self.ip = snapshot.ip
+        self.relative_base = snapshot.relative_base
+        self.inputs = deque(snapshot.inputs)
+        self.outputs = list(snapshot.outputs)
+        self.halted = snapshot.halted
+        self.waiting_for_input = snapshot.waiting_for_input
+
+    def run(self) -> List[int]:
+        """Run the program until it halts or waits for input and return all outputs so far."""
+        memory = self.memory
+        dispatch = self._dispatch
+        self.waiting_for_input = False
+        while not self.halted:
+            if not 0 <= self.ip < len(memory):
+                raise ValueError(f"Invalid intcode instruction address {self.ip}, memory has {len(memory)} values")
+            try:
+                handler, modes = dispatch[memory[self.ip]]
+            except KeyError:
+                raise ValueError(f"Invalid intcode instruction {memory[self.ip]} at address {self.ip}") from None
+            handler(modes)
+            if self.waiting_for_input:
+                break
+            self.n_instructions += 1
+        return self.outputs
+
+
+def run_intcode(code: List[int], inputs: Iterable[int] = ()) -> List[int]:
+    """Run an intcode program and return its memory once it halts, the code itself is left untouched."""
+    vm = IntcodeVM(code, inputs)
+    vm.run()
+    return vm.memory[: len(code)].tolist()
+
+
+def neighbor_function(graph: Graph) -> Neighbors:
+    """Return a callback that yields the (neighbor, weight) pairs of a node in the graph."""
+    if callable(graph):
+        return graph
+    return lambda node: graph[node].items()
+
+
+@profiled()
 def dijkstra(
-    graph: Dict[Coord, Dict[Coord, int]], start: Coord
+    graph: Graph, start: Coord, targets: Optional[Collection[Coord]] = None
 ) -> Tuple[Dict[Coord, Coord], Dict[Coord, Union[float, int]]]:
     """
     Dijkstra algorithm implementation.
 
     Taken from:
     https://levelup.gitconnected.com/dijkstra-algorithm-in-python-8f0e75e3f16e
+
+    The graph is an adjacency dict or a callback that generates the edges of a node lazily.
+    When targets are given the search stops as soon as all of them are settled.
+    Only the costs of settled nodes are final in that case, the others are upper bounds.
     """
+    edges = neighbor_function(graph)
     visited = set()
+    remaining = None if targets is None else set(targets)
     parents_map = {}
     pq: List[Tuple[int, Coord]] = []
     node_costs: Dict[Coord, Union[float, int]] = defaultdict(lambda: float("inf"))
@@ -37,9 +265,16 @@ def dijkstra(
 
     while pq:
         _, node = heap.heappop(pq)
+        if node in visited:
+            # Stale entry, the node was already settled at a lower cost
+            continue
         visited.add(node)
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
 
-        for adj_node, weight in graph[node].items():
+        for adj_node, weight in edges(node):
             if adj_node in visited:
                 continue
 
@@ -49,3 +284,218 @@ def dijkstra(
                 node_costs[adj_node] = new_cost
                 heap.heappush(pq, (int(new_cost), adj_node))
     return parents_map, node_costs
+
+
+def manhattan(node: Coord, goal: Coord) -> int:
+    """Return the Manhattan distance, admissible for up/down/left/right moves that cost at least 1."""
+    return abs(node[0] - goal[0]) + abs(node[1] - goal[1])
+
+
+def chebyshev(node: Coord, goal: Coord) -> int:
+    """Return the Chebyshev distance, admissible when diagonal moves are allowed and cost at least 1."""
+    return max(abs(node[0] - goal[0]), abs(node[1] - goal[1]))
+
+
+@profiled()
+def astar(
+    graph: Graph, start: Coord, goal: Coord, heuristic: Heuristic = manhattan
+) -> Tuple[Dict[Coord, Coord], Dict[Coord, Union[float, int]], int]:
+    """
+    Search the shortest path with A*, using the same graph contract as dijkstra.
+
+    The heuristic estimates the cost from a node to the goal, it must never overestimate it and
+    should be consistent (never drop by more than the edge weight) for the result to be optimal.
+    Besides the parents map and node costs, the number of expanded nodes is returned.
+    """
+    edges = neighbor_function(graph)
+    visited = set()
+    parents_map = {}
+    pq: List[Tuple[int, int, Coord]] = []
+    node_costs: Dict[Coord, Union[float, int]] = defaultdict(lambda: float("inf"))
+    node_costs[start] = 0
+    heap.heappush(pq, (heuristic(start, goal), 0, start))
+    n_expanded = 0
+
+    while pq:
+        _, cost, node = heap.heappop(pq)
+        if node in visited:
+            continue
+        visited.add(node)
+        n_expanded += 1
+        if node == goal:
+            break
+
+        for adj_node, weight in edges(node):
+            if adj_node in visited:
+                continue
+
+            new_cost = cost + weight
+            if node_costs[adj_node] > new_cost:
+                parents_map[adj_node] = node
+                node_costs[adj_node] = new_cost
+                heap.heappush(pq, (new_cost + heuristic(adj_node, goal), new_cost, adj_node))
+    return parents_map, node_costs, n_expanded
+
+
+@profiled()
+def grid_dijkstra(
+    grid: np.ndarray, start: Coord, targets: Optional[Collection[Coord]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dijkstra algorithm on a 2D grid of non-negative entry costs.
+
+    Moves go up, down, left and right and stepping onto a cell costs the value of that cell.
+    Nodes are flat indices (y * width + x) into array-backed buffers, so no adjacency dict is built.
+    The start coord is given as (x, y), like the rest of the repo.
+
+    Returns the parent index and path cost of every cell as arrays with the shape of the grid.
+    Cells that can not be reached hold UNREACHED in both arrays.
+    As in dijkstra, the search stops once all targets are settled when targets are given.
+    """
+    height, width = grid.shape
+    n_nodes = height * width
+    weights = grid.ravel().tolist()
+    costs = array("q", [UNREACHED]) * n_nodes
+    parents = array("q", [UNREACHED]) * n_nodes
+    settled = bytearray(n_nodes)
+    remaining = None if targets is None else {y * width + x for x, y in targets}
+
+    start_node = start[1] * width + start[0]
+    costs[start_node] = 0
+    # Heap items pack (cost, node) into a single int to avoid a tuple per push
+    pq = [start_node]
+
+    while pq:
+        cost, node = divmod(heap.heappop(pq), n_nodes)
+        if settled[node]:
+            continue
+        settled[node] = 1
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+
+        x = node % width
+        for adj_node in (
+            node - 1 if x > 0 else -1,
+            node + 1 if x + 1 < width else -1,
+            node - width,
+            node + width if node + width < n_nodes else -1,
+        ):
+            if adj_node < 0 or settled[adj_node]:
+                continue
+            new_cost = cost + weights[adj_node]
+            if costs[adj_node] == UNREACHED or new_cost < costs[adj_node]:
+                costs[adj_node] = new_cost
+                parents[adj_node] = node
+                heap.heappush(pq, new_cost * n_nodes + adj_node)
+
+    return (
+        np.frombuffer(parents, dtype=np.int64).reshape(grid.shape),
+        np.frombuffer(costs, dtype=np.int64).reshape(grid.shape),
+    )
+
+
+@profiled()
+def bfs(
+    graph: UnweightedGraph, sources: Iterable[Coord], targets: Optional[Collection[Coord]] = None
+) -> Tuple[Dict[Coord, Coord], Dict[Coord, int]]:
+    """
+    Breadth first search from one or more sources.
+
+    The graph maps a node to its neighbors, either as a dict or as a callback.
+    Only parent pointers are stored, use reconstruct_path to get the path to a node.
+    When targets are given the search stops as soon as the first one of them is reached.
+    """
+    next_nodes = graph if callable(graph) else lambda node: graph.get(node, ())
+    target_set = set() if targets is None else set(targets)
+    parents_map: Dict[Coord, Coord] = {}
+    distances = {source: 0 for source in sources}
+    if not target_set.isdisjoint(distances):
+        return parents_map, distances
+
+    queue = deque(distances)
+    while queue:
+        node = queue.popleft()
+        for adj_node in next_nodes(node):
+            if adj_node in distances:
+                continue
+            parents_map[adj_node] = node
+            distances[adj_node] = distances[node] + 1
+            if adj_node in target_set:
+                return parents_map, distances
+            queue.append(adj_node)
+    return parents_map, distances
+
+
+def reconstruct_path(parents_map: Dict[Coord, Coord], end: Coord) -> List[Coord]:
+    """Follow the parent pointers back from the end node and return the path from its source."""
+    path = [end]
+    while path[-1] in parents_map:
+        path.append(parents_map[path[-1]])
+    return path[::-1]
+
+
+@profiled()
+def grid_bfs(
+    grid: np.ndarray,
+    sources: Iterable[Coord],
+    can_move: Callable[[int, int], bool],
+    targets: Optional[Collection[Coord]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Breadth first search over a 2D grid with up, down, left and right moves.
+
+    A move is allowed when can_move(value of current cell, value of next cell) is true.
+    Like grid_dijkstra, the parent index and distance of every cell are returned as arrays with the
+    shape of the grid and UNREACHED marks cells that were not reached.
+    When targets are given the search stops as soon as the first one of them is reached.
+    """
+    height, width = grid.shape
+    n_nodes = height * width
+    values = grid.ravel().tolist()
+    distances = array("q", [UNREACHED]) * n_nodes
+    parents = array("q", [UNREACHED]) * n_nodes
+    target_nodes = set() if targets is None else {y * width + x for x, y in targets}
+
+    queue: deque = deque()
+    for x, y in sources:
+        node = y * width + x
+        distances[node] = 0
+        queue.append(node)
+    if not target_nodes.isdisjoint(queue):
+        queue.clear()
+
+    while queue:
+        node = queue.popleft()
+        x = node % width
+        for adj_node in (
+            node - 1 if x > 0 else -1,
+            node + 1 if x + 1 < width else -1,
+            node - width,
+            node + width if node + width < n_nodes else -1,
+        ):
+            if adj_node < 0 or distances[adj_node] != UNREACHED or not can_move(values[node], values[adj_node]):
+                continue
+            parents[adj_node] = node
+            distances[adj_node] = distances[node] + 1
+            if adj_node in target_nodes:
+                queue.clear()
+                break
+            queue.append(adj_node)
+
+    return (
+        np.frombuffer(parents, dtype=np.int64).reshape(grid.shape),
+        np.frombuffer(distances, dtype=np.int64).reshape(grid.shape),
+    )
+
+
+def grid_path(parents: np.ndarray, end: Coord) -> List[Coord]:
+    """Follow the parent indices of grid_bfs or grid_dijkstra back from the end coord and return the path."""
+    width = parents.shape[1]
+    node = end[1] * width + end[0]
+    path = []
+    while node != UNREACHED:
+        path.append((node % width, node // width))
+        node = int(parents.flat[node])
+    return path[::-1]
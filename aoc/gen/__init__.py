@@ -0,0 +1,24 @@
+"""Seeded generators of puzzle inputs at any size, one module per year with a function per day.
+
+Every generator takes the size of the input as first argument and a seed, and returns text in the format of the
+real input.txt, e.g. aoc.gen.y2021.day15(500) is a 500x500 risk map.
+"""
+import importlib
+from typing import Callable
+
+import numpy as np
+
+
+def get_generator(year: int, day: int) -> Callable[..., str]:
+    """Return the input generator of a day, e.g. get_generator(2021, 15) is aoc.gen.y2021.day15."""
+    try:
+        return getattr(importlib.import_module(f"aoc.gen.y{year}"), f"day{day:02}")  # type: ignore[no-any-return]
+    except (ImportError, AttributeError):
+        raise KeyError(f"No input generator for {year} day {day}") from None
+
+
+def grid_to_text(grid: np.ndarray, offset: str = "0") -> str:
+    """Format a 2D array of small integers as lines of characters, adding ord(offset) to every value."""
+    codes = np.full((grid.shape[0], grid.shape[1] + 1), ord("\n"), dtype=np.uint8)
+    codes[:, :-1] = grid + ord(offset)
+    return codes.tobytes().decode()
@@ -0,0 +1,8 @@
+"""Input generators for 2019."""
+import random
+
+
+def day01(n_modules: int = 100, seed: int = 0) -> str:
+    """Generate module masses, one per line."""
+    rng = random.Random(seed)
+    return "".join(f"{rng.randint(50_000, 150_000)}\n" for _ in range(n_modules))
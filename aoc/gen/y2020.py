@@ -0,0 +1,19 @@
+"""Input generators for 2020."""
+import random
+
+HEX_DIRECTIONS = ("e", "se", "sw", "w", "nw", "ne")
+
+
+def day24(n_tiles: int = 400, seed: int = 0, max_steps: int = 20) -> str:
+    """Generate lines of hex directions that each lead to a tile to flip."""
+    rng = random.Random(seed)
+    return "".join("".join(rng.choices(HEX_DIRECTIONS, k=rng.randint(1, max_steps))) + "\n" for _ in range(n_tiles))
+
+
+def day25(loop_size: int = 1_000_000, seed: int = 0) -> str:
+    """Generate the public keys of a card with the given loop size and of a door with a random one."""
+    rng = random.Random(seed)
+    modulus = 20201227
+    card_key = pow(7, loop_size, modulus)
+    door_key = pow(7, rng.randint(1, modulus - 1), modulus)
+    return f"{card_key}\n{door_key}\n"
@@ -0,0 +1,234 @@
+"""Input generators for 2021."""
+import random
+import string
+from typing import Dict, List
+
+import numpy as np
+
+from aoc.gen import grid_to_text
+
+# Segments that are lit per digit on a seven segment display
+DIGIT_SEGMENTS = ("abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg")
+BRACKET_PAIRS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+# Directions of horizontal, vertical and diagonal vent lines
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def day01(n_depths: int = 2000, seed: int = 0) -> str:
+    """Generate a random walk of sonar depths, one per line."""
+    rng = np.random.default_rng(seed)
+    depths = 100 + np.abs(np.cumsum(rng.integers(-20, 30, n_depths)))
+    return "".join(f"{depth}\n" for depth in depths.tolist())
+
+
+def day02(n_commands: int = 1000, seed: int = 0) -> str:
+    """Generate submarine commands like "forward 5"."""
+    rng = random.Random(seed)
+    return "".join(f"{rng.choice(('forward', 'down', 'up'))} {rng.randint(1, 9)}\n" for _ in range(n_commands))
+
+
+def _split_numbers(rng: random.Random, n_numbers: int, width: int) -> List[int]:
+    """
+    Return unique numbers of the given width, where any two or more numbers with the same prefix differ in the next bit.
+
+    That is what the bit criteria filters of part 2 need, they never drop all numbers.
+    """
+    if n_numbers == 1:
+        return [rng.randrange(2**width)]
+    # Both halves need a number and can hold at most half of the numbers of this width
+    half = 2 ** (width - 1)
+    n_ones = round(rng.gauss(n_numbers / 2, n_numbers**0.5 / 2))
+    n_ones = min(max(n_ones, 1, n_numbers - half), n_numbers - 1, half)
+    zeros = _split_numbers(rng, n_numbers - n_ones, width - 1)
+    ones = _split_numbers(rng, n_ones, width - 1)
+    return zeros + [half + number for number in ones]
+
+
+def day03(n_numbers: int = 1000, seed: int = 0, width: int = 12) -> str:
+    """Generate unique binary numbers of a fixed width, width grows when there are not enough numbers."""
+    rng = random.Random(seed)
+    width = max(width, n_numbers.bit_length() + 1)
+    numbers = _split_numbers(rng, n_numbers, width)
+    rng.shuffle(numbers)
+    return "".join(f"{number:0{width}b}\n" for number in numbers)
+
+
+def day04(n_boards: int = 100, seed: int = 0) -> str:
+    """Generate the drawn bingo numbers and 5x5 boards, every board wins once all numbers are drawn."""
+    rng = random.Random(seed)
+    n_numbers = max(100, 2 * n_boards)
+    numbers = list(range(n_numbers))
+    rng.shuffle(numbers)
+    blocks = [",".join(map(str, numbers))]
+    for _ in range(n_boards):
+        board = rng.sample(range(n_numbers), 25)
+        blocks.append("\n".join(" ".join(f"{x:2}" for x in board[row : row + 5]) for row in range(0, 25, 5)))
+    return "\n\n".join(blocks) + "\n"
+
+
+def _room(start: int, step: int, size: int) -> int:
+    """Return how many steps fit between a coordinate and the edge of a square of the given size."""
+    if step > 0:
+        return size - 1 - start
+    if step < 0:
+        return start
+    return size
+
+
+def day05(n_lines: int = 500, seed: int = 0, size: int = 1000) -> str:
+    """Generate horizontal, vertical and diagonal vent lines within a square of the given size."""
+    rng = random.Random(seed)
+    # A line needs two points
+    size = max(size, 2)
+    lines = []
+    for _ in range(n_lines):
+        x1, y1 = rng.randrange(size), rng.randrange(size)
+        # The room to the edge of the square along the direction, draw another direction when there is none
+        room = 0
+        while room < 1:
+            dx, dy = rng.choice(DIRECTIONS)
+            room = min(_room(x1, dx, size), _room(y1, dy, size))
+        length = rng.randint(1, min(room, max(size // 2, 1)))
+        lines.append(f"{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}\n")
+    return "".join(lines)
+
+
+def day06(n_fish: int = 300, seed: int = 0) -> str:
+    """Generate the comma separated ages of lanternfish."""
+    rng = random.Random(seed)
+    return ",".join(str(rng.randint(1, 5)) for _ in range(n_fish)) + "\n"
+
+
+def day07(n_crabs: int = 1000, seed: int = 0) -> str:
+    """Generate the comma separated horizontal positions of crabs."""
+    rng = random.Random(seed)
+    return ",".join(str(int(rng.expovariate(1 / 400))) for _ in range(n_crabs)) + "\n"
+
+
+def _scramble(rng: random.Random, wires: Dict[str, str], digit: int) -> str:
+    """Return the scrambled segments of a digit in random order."""
+    segments = [wires[segment] for segment in DIGIT_SEGMENTS[digit]]
+    return "".join(rng.sample(segments, len(segments)))
+
+
+def day08(n_displays: int = 200, seed: int = 0) -> str:
+    """Generate the ten scrambled signal patterns and four output digits of seven segment displays."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(n_displays):
+        wires = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+        patterns = [_scramble(rng, wires, digit) for digit in rng.sample(range(10), 10)]
+        output = [_scramble(rng, wires, rng.randrange(10)) for _ in range(4)]
+        lines.append(f"{' '.join(patterns)} | {' '.join(output)}\n")
+    return "".join(lines)
+
+
+def day09(size: int = 100, seed: int = 0) -> str:
+    """Generate a square height map of digits, with enough 9s to split it into many basins."""
+    rng = np.random.default_rng(seed)
+    # Below the percolation threshold of about 59% the cells that are not 9 form many small basins
+    return grid_to_text(np.where(rng.random((size, size)) < 0.45, 9, rng.integers(0, 9, (size, size))))
+
+
+def _bracket_line(rng: random.Random, length: int) -> str:
+    """Generate a navigation line that is either corrupted or incomplete, but never complete."""
+    line: List[str] = []
+    open_brackets: List[str] = []
+    corrupt = rng.random() < 0.5
+    while len(line) < length or not open_brackets:
+        if open_brackets and rng.random() < 0.45:
+            line.append(BRACKET_PAIRS[open_brackets.pop()])
+        else:
+            open_brackets.append(rng.choice(list(BRACKET_PAIRS)))
+            line.append(open_brackets[-1])
+    if corrupt:
+        expected = BRACKET_PAIRS[open_brackets[-1]]
+        line.append(rng.choice([bracket for bracket in BRACKET_PAIRS.values() if bracket != expected]))
+    return "".join(line)
+
+
+def day10(n_lines: int = 100, seed: int = 0, length: int = 100) -> str:
+    """Generate lines of brackets, roughly half of them corrupted and the others incomplete."""
+    rng = random.Random(seed)
+    return "".join(_bracket_line(rng, length) + "\n" for _ in range(n_lines))
+
+
+def day11(size: int = 10, seed: int = 0, max_energy: int = 4) -> str:
+    """
+    Generate a square grid of octopus energy levels up to max_energy.
+
+    Grids with all levels from 0 to 9 often never flash all at once, levels up to 4 do within a few dozen steps.
+    """
+    return grid_to_text(np.random.default_rng(seed).integers(0, max_energy + 1, (size, size)))
+
+
+def day12(n_small_caves: int = 8, seed: int = 0, n_big_caves: int = 2) -> str:
+    """
+    Generate a cave system, the number of paths grows exponentially with the number of caves.
+
+    Big caves are never connected to each other, otherwise there would be endless paths.
+    """
+    rng = random.Random(seed)
+    names = sorted({"".join(rng.choices(string.ascii_lowercase, k=2)) for _ in range(4 * n_small_caves)})
+    small = rng.sample(names, n_small_caves)
+    big = [name.upper() for name in rng.sample(small, n_big_caves)]
+    edges = {("start", rng.choice(small)), (rng.choice(big), "end"), (rng.choice(small), "end")}
+    for cave in small:
+        edges.add((cave, rng.choice(big)))
+        edges.add((cave, rng.choice([other for other in small if other != cave])))
+    return "".join(f"{start}-{end}\n" for start, end in sorted(edges))
+
+
+def day13(n_dots: int = 800, seed: int = 0, n_folds: int = 10) -> str:
+    """Generate dots and folds that each halve the paper exactly, no dot lies on a fold line."""
+    rng = random.Random(seed)
+    # Start from dots on the folded 39x6 paper and unfold them one fold at a time
+    width, height = 39, 6
+    dots = {(rng.randrange(width), rng.randrange(height)) for _ in range(n_dots)}
+    instructions = []
+    for _ in range(n_folds):
+        if rng.random() < 0.5:
+            instructions.append(f"fold along x={width}")
+            dots = {(2 * width - x if rng.random() < 0.5 else x, y) for x, y in dots}
+            width = 2 * width + 1
+        else:
+            instructions.append(f"fold along y={height}")
+            dots = {(x, 2 * height - y if rng.random() < 0.5 else y) for x, y in dots}
+            height = 2 * height + 1
+    coords = "\n".join(f"{x},{y}" for x, y in sorted(dots))
+    return coords + "\n\n" + "\n".join(reversed(instructions)) + "\n"
+
+
+def day14(template_length: int = 20, seed: int = 0, n_elements: int = 10) -> str:
+    """Generate a polymer template and an insertion rule for every pair of elements."""
+    rng = random.Random(seed)
+    elements = rng.sample(string.ascii_uppercase, n_elements)
+    template = "".join(rng.choices(elements, k=template_length))
+    rules = [f"{a}{b} -> {rng.choice(elements)}" for a in elements for b in elements]
+    return template + "\n\n" + "\n".join(rules) + "\n"
+
+
+def day15(width: int = 100, seed: int = 0) -> str:
+    """Generate a square risk map of digits 1 to 9."""
+    return grid_to_text(np.random.default_rng(seed).integers(1, 10, (width, width)))
+
+
+def _packet(rng: random.Random, depth: int) -> str:
+    """Generate the bits of a packet, operators contain 1 to 4 sub packets up to the given depth."""
+    version = f"{rng.randrange(8):03b}"
+    if depth == 0 or rng.random() < 0.3:
+        value = rng.randrange(1 << 16)
+        groups = [f"{value >> shift & 15:04b}" for shift in range(12, -1, -4)]
+        return version + "100" + "".join(f"1{group}" for group in groups[:-1]) + f"0{groups[-1]}"
+    type_id = rng.choice([0, 1, 2, 3, 5, 6, 7])
+    # The comparison operators take exactly two sub packets
+    sub_packets = [_packet(rng, depth - 1) for _ in range(2 if type_id > 4 else rng.randint(1, 4))]
+    return version + f"{type_id:03b}1{len(sub_packets):011b}" + "".join(sub_packets)
+
+
+def day16(depth: int = 6, seed: int = 0) -> str:
+    """Generate a hexadecimal transmission of nested packets, sub packets are counted instead of measured."""
+    bits = _packet(random.Random(seed), depth)
+    bits += "0" * (-len(bits) % 4)
+    # Without a trailing newline, hex_to_binary of the solution counts it as four extra bits
+    return f"{int(bits, 2):0{len(bits) // 4}X}"
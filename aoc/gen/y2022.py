@@ -0,0 +1,188 @@
+"""Input generators for 2022."""
+import random
+import string
+from typing import List
+
+import numpy as np
+
+from aoc.gen import grid_to_text
+
+
+def day01(n_elves: int = 250, seed: int = 0) -> str:
+    """Generate the calories of the food items per elf, elves are separated by a blank line."""
+    rng = random.Random(seed)
+    elves = ("\n".join(str(rng.randint(1000, 60_000)) for _ in range(rng.randint(1, 15))) for _ in range(n_elves))
+    return "\n\n".join(elves) + "\n"
+
+
+def day02(n_rounds: int = 2500, seed: int = 0) -> str:
+    """Generate rounds of rock paper scissors like "A Y"."""
+    rng = random.Random(seed)
+    return "".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(n_rounds))
+
+
+def _rucksack(rng: random.Random, letters: List[str], badge: str, half_size: int) -> str:
+    """Fill a rucksack from its own letters, the first one is in both compartments and the badge in one of them."""
+    shared, first_letters, second_letters = letters[0], letters[1 : len(letters) // 2], letters[len(letters) // 2 :]
+    first = [shared] + rng.choices(first_letters, k=half_size - 1)
+    second = [shared] + rng.choices(second_letters, k=half_size - 1)
+    rng.choice((first, second))[-1] = badge
+    rng.shuffle(first)
+    rng.shuffle(second)
+    return "".join(first + second)
+
+
+def day03(n_groups: int = 100, seed: int = 0, half_size: int = 12) -> str:
+    """Generate groups of three rucksacks that share one badge, each has one item in both compartments."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(n_groups):
+        badge, *letters = rng.sample(string.ascii_letters, len(string.ascii_letters))
+        # Every rucksack of the group gets its own letters so the badge is the only common one
+        for i in range(3):
+            lines.append(_rucksack(rng, letters[i * 17 : (i + 1) * 17], badge, half_size) + "\n")
+    return "".join(lines)
+
+
+def day04(n_pairs: int = 1000, seed: int = 0, max_section: int = 99) -> str:
+    """Generate pairs of section ranges like "2-4,6-8"."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(n_pairs):
+        ranges = [sorted((rng.randint(1, max_section), rng.randint(1, max_section))) for _ in range(2)]
+        lines.append(",".join(f"{start}-{stop}" for start, stop in ranges) + "\n")
+    return "".join(lines)
+
+
+def day05(n_moves: int = 500, seed: int = 0, n_stacks: int = 9, height: int = 8) -> str:
+    """Generate stacks of crates and moves between them that never empty a stack."""
+    rng = random.Random(seed)
+    stacks = [rng.choices(string.ascii_uppercase, k=rng.randint(1, height)) for _ in range(n_stacks)]
+    rows = []
+    for level in range(max(map(len, stacks)) - 1, -1, -1):
+        rows.append(" ".join(f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks).rstrip())
+    rows.append(" ".join(f" {i + 1} " for i in range(n_stacks)).rstrip())
+    moves = []
+    for _ in range(n_moves):
+        source = rng.choice([i for i, stack in enumerate(stacks) if len(stack) > 1])
+        target = rng.choice([i for i in range(n_stacks) if i != source])
+        n = rng.randint(1, len(stacks[source]) - 1)
+        stacks[target] += stacks[source][-n:]
+        del stacks[source][-n:]
+        moves.append(f"move {n} from {source + 1} to {target + 1}")
+    return "\n".join(rows) + "\n\n" + "\n".join(moves) + "\n"
+
+
+def day06(length: int = 4096, seed: int = 0) -> str:
+    """Generate a datastream that only has 4 and 14 different characters in a row at its end."""
+    rng = random.Random(seed)
+    # Three letters can never make a marker
+    stream = rng.choices("abc", k=length)
+    return "".join(stream) + "".join(rng.sample("defghijklmnopqrstuvwxyz", 14)) + "\n"
+
+
+def _list_dir(rng: random.Random, path_depth: int, n_dirs: List[int]) -> List[str]:
+    """Generate the terminal output of listing a dir and walking its subdirs, n_dirs counts down the dirs left."""
+    subdirs: List[str] = []
+    lines = ["$ ls"]
+    for i in range(rng.randint(1, 5)):
+        lines.append(f"{rng.randint(1000, 300_000)} {rng.choice(string.ascii_lowercase)}{i}.txt")
+    # The root takes all dirs that are left once its subtrees are done
+    while n_dirs[0] > 0 and (path_depth == 0 or len(subdirs) < 4 and rng.random() < 0.8 / (1 + 0.2 * path_depth)):
+        n_dirs[0] -= 1
+        subdirs.append(f"d{n_dirs[0]}")
+        lines.append(f"dir {subdirs[-1]}")
+    for subdir in subdirs:
+        lines.append(f"$ cd {subdir}")
+        lines += _list_dir(rng, path_depth + 1, n_dirs)
+        lines.append("$ cd ..")
+    return lines
+
+
+def day07(n_dirs: int = 200, seed: int = 0) -> str:
+    """Generate a terminal session that lists a random directory tree depth first."""
+    rng = random.Random(seed)
+    return "\n".join(["$ cd /"] + _list_dir(rng, 0, [n_dirs])) + "\n"
+
+
+def day08(size: int = 99, seed: int = 0) -> str:
+    """Generate a square map of tree heights."""
+    return grid_to_text(np.random.default_rng(seed).integers(0, 10, (size, size)))
+
+
+def day09(n_moves: int = 2000, seed: int = 0, max_distance: int = 20) -> str:
+    """Generate rope moves like "R 4"."""
+    rng = random.Random(seed)
+    return "".join(f"{rng.choice('RLUD')} {rng.randint(1, max_distance)}\n" for _ in range(n_moves))
+
+
+def day10(n_instructions: int = 150, seed: int = 0) -> str:
+    """Generate CPU instructions, noop or addx with a value that keeps the register near the screen."""
+    rng = random.Random(seed)
+    lines = []
+    x = 1
+    for _ in range(n_instructions):
+        if rng.random() < 0.3:
+            lines.append("noop\n")
+        else:
+            value = rng.choice([v for v in range(-10, 11) if v != 0 and 0 <= x + v < 40])
+            x += value
+            lines.append(f"addx {value}\n")
+    return "".join(lines)
+
+
+def _primes(n: int) -> List[int]:
+    """Return the first n primes."""
+    primes: List[int] = []
+    candidate = 2
+    while len(primes) < n:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def day11(n_monkeys: int = 8, seed: int = 0, n_items: int = 4) -> str:
+    """Generate monkeys with items, an operation, a prime divisibility test and two other monkeys to throw to."""
+    rng = random.Random(seed)
+    # Every monkey throws to two others, none of them the squaring monkey
+    n_monkeys = max(n_monkeys, 4)
+    divisors = rng.sample(_primes(max(n_monkeys, 10)), n_monkeys)
+    # Like in real inputs one monkey squares. Part 1 does not reduce worry levels modulo the divisors, so they grow
+    # doubly exponentially when items keep coming back to a squaring monkey, it only squares its starting items.
+    squaring = rng.randrange(n_monkeys)
+    blocks = []
+    for i, divisor in enumerate(divisors):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, n_items)))
+        if i == squaring:
+            operation = "old * old"
+        else:
+            operation = rng.choice([f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}"])
+        true_target, false_target = rng.sample([j for j in range(n_monkeys) if j not in (i, squaring)], 2)
+        blocks.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {divisor}\n"
+            f"    If true: throw to monkey {true_target}\n"
+            f"    If false: throw to monkey {false_target}"
+        )
+    return "\n\n".join(blocks) + "\n"
+
+
+def day12(width: int = 150, seed: int = 0, height: int = 40) -> str:
+    """
+    Generate a height map that rises from a to z from left to right with lower noise on top.
+
+    A random row keeps the plain slope, so there is always a path from S on its left to E on its right.
+    """
+    rng = np.random.default_rng(seed)
+    width = max(width, 26)
+    slope = np.arange(width) * 26 // width
+    heights = np.clip(slope - rng.integers(0, 4, (height, width)), 0, 25)
+    row = int(rng.integers(height))
+    heights[row] = slope
+    text = grid_to_text(heights, "a")
+    start = row * (width + 1)
+    end = start + width - 1
+    return text[:start] + "S" + text[start + 1 : end] + "E" + text[end + 1 :]
@@ -0,0 +1,41 @@
+"""Read puzzle inputs lazily so large files are processed in constant memory."""
+import io
+import mmap
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+Lines = Union[str, Iterable[str]]
+
+
+def iter_lines(lines: Lines) -> Iterator[str]:
+    """
+    Yield lines without their line ending from a whole text or from an iterable of lines, e.g. an open file.
+
+    Solvers that loop over iter_lines(text) accept both the puzzle text and the lazy read_lines of a file.
+    """
+    if isinstance(lines, str):
+        lines = io.StringIO(lines)
+    for line in lines:
+        yield line.rstrip("\r\n")
+
+
+def read_lines(path: Union[str, Path], buffer_size: int = 1 << 20) -> Iterator[str]:
+    """Yield the lines of a file through a read buffer, the file is closed when the generator is done."""
+    with open(path, buffering=buffer_size) as f:
+        yield from iter_lines(f)
+
+
+def map_input(path: Union[str, Path]) -> memoryview:
+    """
+    Memory-map a file read-only and return a view of its bytes.
+
+    The pages come from the page cache, so processes that map the same input share them instead of each
+    holding a copy, and text_to_byte_grid wraps the view without copying. The mapping is closed once the view
+    and every array made from it are garbage collected.
+    """
+    with open(path, "rb") as f:
+        # Empty files can not be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
@@ -0,0 +1,178 @@
+"""Modular arithmetic, e.g. the discrete logarithm for the handshake of y_2020_day_25.
+
+discrete_log splits the group generated by the base into subgroups of prime order with Pohlig-Hellman and solves each
+with baby-step giant-step. It takes about sqrt(q) steps for the largest prime factor q of the order of the base, so it
+is fast whenever that order is smooth, even for moduli of 60 bits and more.
+"""
+import math
+import random
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+# Miller-Rabin with these bases is exact below 3.3 * 10**24
+WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+SMALL_PRIMES = tuple(p for p in range(2, 1000) if all(p % d for d in range(2, math.isqrt(p) + 1)))
+
+
+def is_prime(n: int) -> bool:
+    """Check if n is prime with Miller-Rabin, exact below 3.3 * 10**24 and probable above."""
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES[:13]:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in WITNESSES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_rho(n: int) -> int:
+    """Return a nontrivial factor of an odd composite n with Brent's variant of Pollard's rho."""
+    rng = random.Random(n)
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                # Multiply the differences together and take one gcd per batch of m steps
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # The batch overshot, redo it one step at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def factorize(n: int) -> Dict[int, int]:
+    """Return the prime factors of n > 0 with their multiplicities."""
+    if n < 1:
+        raise ValueError(f"Can not factorize {n}")
+    factors: Counter = Counter()
+    for p in SMALL_PRIMES:
+        while n % p == 0:
+            factors[p] += 1
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_prime(m):
+            factors[m] += 1
+        else:
+            d = _pollard_rho(m)
+            stack += [d, m // d]
+    return dict(factors)
+
+
+def totient(n: int) -> int:
+    """Return Euler's totient of n, the order of the multiplicative group modulo n."""
+    for p in factorize(n):
+        n = n // p * (p - 1)
+    return n
+
+
+def _order_factors(base: int, modulus: int, group_order: Optional[int] = None) -> Dict[int, int]:
+    """Return the prime factors of the multiplicative order of base, found by dividing down the group order."""
+    order = group_order or totient(modulus)
+    factors = factorize(order)
+    for p, e in factors.items():
+        for _ in range(e):
+            if pow(base, order // p, modulus) != 1:
+                break
+            order //= p
+            factors[p] -= 1
+    return {p: e for p, e in factors.items() if e}
+
+
+def multiplicative_order(base: int, modulus: int, group_order: Optional[int] = None) -> int:
+    """Return the smallest k > 0 with base**k % modulus == 1, base must be coprime to the modulus."""
+    return math.prod(p**e for p, e in _order_factors(base, modulus, group_order).items())
+
+
+def crt(residues: Iterable[int], moduli: Iterable[int]) -> Tuple[int, int]:
+    """Return the x modulo the product of pairwise coprime moduli that has the given residue for each modulus."""
+    x, product = 0, 1
+    for residue, modulus in zip(residues, moduli):
+        # Adjust x by a multiple of the product so far, that keeps all earlier residues
+        x += (residue - x) * pow(product, -1, modulus) % modulus * product
+        product *= modulus
+    return x % product, product
+
+
+def baby_step_giant_step(base: int, target: int, modulus: int, order: int) -> Optional[int]:
+    """Return the smallest x < order with base**x % modulus == target, or None, in about sqrt(order) steps."""
+    m = math.isqrt(order - 1) + 1
+    baby_steps: Dict[int, int] = {}
+    value = 1
+    for j in range(m):
+        baby_steps.setdefault(value, j)
+        value = value * base % modulus
+    giant_step = pow(base, -m, modulus)
+    value = target
+    for i in range(m):
+        baby_step = baby_steps.get(value)
+        if baby_step is not None:
+            return i * m + baby_step
+        value = value * giant_step % modulus
+    return None
+
+
+def _prime_power_log(base: int, target: int, modulus: int, p: int, e: int) -> int:
+    """Solve the discrete log in a subgroup of order p**e, one base p digit of the exponent at a time."""
+    # The base raised to p**(e - 1) generates the subgroup of order p
+    generator = pow(base, p ** (e - 1), modulus)
+    x = 0
+    for k in range(e):
+        # Remove the digits found so far, what remains of the target lies in the subgroup of order p
+        remainder = pow(pow(base, -x, modulus) * target % modulus, p ** (e - 1 - k), modulus)
+        digit = baby_step_giant_step(generator, remainder, modulus, p)
+        if digit is None:
+            raise ValueError(f"{target} is not a power of {base} modulo {modulus}")
+        x += digit * p**k
+    return x
+
+
+def discrete_log(base: int, target: int, modulus: int, group_order: Optional[int] = None) -> int:
+    """
+    Return the smallest x >= 0 with base**x % modulus == target % modulus, with Pohlig-Hellman.
+
+    The group order defaults to the totient of the modulus, pass it to skip factorizing the modulus, e.g. p - 1 for a
+    prime p. Raises ValueError when there is no such x or when base is not coprime to the modulus.
+    """
+    target %= modulus
+    if math.gcd(base, modulus) != 1:
+        raise ValueError(f"{base} is not invertible modulo {modulus}")
+    order_factors = _order_factors(base, modulus, group_order)
+    order = math.prod(p**e for p, e in order_factors.items())
+    residues, moduli = [], []
+    for p, e in order_factors.items():
+        cofactor = order // p**e
+        residues.append(_prime_power_log(pow(base, cofactor, modulus), pow(target, cofactor, modulus), modulus, p, e))
+        moduli.append(p**e)
+    x, _ = crt(residues, moduli)
+    if pow(base, x, modulus) != target:
+        raise ValueError(f"{target} is not a power of {base} modulo {modulus}")
+    return x
@@ -0,0 +1,81 @@
+"""Run independent pure computations over a process pool."""
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import closing
+from itertools import islice
+from typing import Any, Callable, Generator, Iterable, List, Optional, Set, Tuple, TypeVar
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+# Set once in every worker process by _init_worker
+_payload: Any = None
+
+
+def _init_worker(payload: Any) -> None:
+    """Keep the shared payload in the worker so it is only pickled once per process."""
+    global _payload
+    _payload = payload
+
+
+def _run_chunk(func: Callable[[Any, Item], Result], chunk: List[Item]) -> List[Tuple[Item, Result]]:
+    """Call func for every item in the chunk with the payload of this worker."""
+    return [(item, func(_payload, item)) for item in chunk]
+
+
+def parallel_map(
+    func: Callable[[Any, Item], Result],
+    items: Iterable[Item],
+    payload: Any = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 64,
+) -> Generator[Tuple[Item, Result], None, None]:
+    """
+    Yield (item, func(payload, item)) pairs as soon as the chunk that contains them is done.
+
+    The payload, e.g. an intcode program, is sent to every worker once instead of with every item.
+    func has to be a module level function so it can be pickled. Results come in completion order and
+    only a couple of chunks per worker are queued at a time, so items can be a lazy or endless iterator.
+    Closing the generator early cancels the chunks that did not start yet.
+    """
+    item_iter = iter(items)
+    n_workers = max_workers or os.cpu_count() or 1
+    max_pending = 2 * n_workers
+    with ProcessPoolExecutor(n_workers, initializer=_init_worker, initargs=(payload,)) as executor:
+        pending: Set[Future] = set()
+        try:
+            while True:
+                while len(pending) < max_pending:
+                    chunk = list(islice(item_iter, chunk_size))
+                    if not chunk:
+                        break
+                    pending.add(executor.submit(_run_chunk, func, chunk))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def sweep(
+    func: Callable[[Any, Item], Result],
+    items: Iterable[Item],
+    is_target: Callable[[Result], bool],
+    payload: Any = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 64,
+) -> Optional[Tuple[Item, Result]]:
+    """
+    Return an (item, result) pair that hits the target, or None, and cancel the remaining work.
+
+    Results are checked in completion order, so with several hits any one of them can be returned.
+    """
+    with closing(parallel_map(func, items, payload, max_workers, chunk_size)) as results:
+        for item, result in results:
+            if is_target(result):
+                return item, result
+    return None
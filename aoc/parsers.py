@@ -1,15 +1,59 @@
 """Basic utility functions."""
 
-from typing import Any, Callable, List, Optional
+import warnings
+from typing import Any, Callable, List, Optional, Union
 
 import numpy as np
+from numpy.typing import DTypeLike
 
+from aoc.profiling import profiled
 
-def text_to_integer_array(text: str) -> np.ndarray:
-    """Convert a string with newlines to a numpy array with integers."""
-    return np.array([int(line) for line in text.splitlines()])
+# Puzzle input as text or as the raw bytes of e.g. a memory-mapped file
+Text = Union[str, bytes, memoryview]
 
 
+def _parse_integers(text: str, dtype: DTypeLike, sep: str) -> np.ndarray:
+    """Parse separated integers with numpy, raise ValueError for text that is not an integer or out of range."""
+    with warnings.catch_warnings():
+        # NumPy 1.x only warns about text it can not parse and returns the integers before it
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(text, dtype=np.int64, sep=sep)
+        except DeprecationWarning as warning:
+            raise ValueError(str(warning)) from None
+    if not values.size:
+        return values.astype(dtype)
+    int64 = np.iinfo(np.int64)
+    if values.max() == int64.max or values.min() == int64.min:
+        # Values out of range saturate, so only these need to be checked exactly
+        for token in text.replace(",", " ").split():
+            if not int64.min <= int(token) <= int64.max:
+                raise ValueError(f"Integer {token} does not fit in int64")
+    # Smaller types would wrap around, check the range before converting
+    limits = np.iinfo(dtype)
+    if values.min() < limits.min or values.max() > limits.max:
+        raise ValueError(f"Integers from {values.min()} to {values.max()} do not fit in {limits.dtype}")
+    return values.astype(dtype, copy=False)
+
+
+@profiled()
+def text_to_integer_array(text: str, dtype: DTypeLike = np.int64) -> np.ndarray:
+    """
+    Convert a string with newlines to a numpy array with integers.
+
+    The text is parsed by numpy in one pass, no intermediate list of Python ints is built. Text that is not an
+    integer and integers that do not fit in the dtype raise ValueError.
+    """
+    return _parse_integers(text, dtype, " ")
+
+
+@profiled()
+def comma_separated_text_to_integer_array(text: str, dtype: DTypeLike = np.int64) -> np.ndarray:
+    """Convert a string with comma separated integers to a numpy array, parsed like text_to_integer_array."""
+    return _parse_integers(text, dtype, ",")
+
+
+@profiled()
 def unspaced_text_to_2d_list(text: str, dtype: Optional[Callable] = None) -> List[Any]:
     """
     Convert a string with newlines to a list with one element per character in the string.
@@ -22,6 +66,42 @@ def unspaced_text_to_2d_list(text: str, dtype: Optional[Callable] = None) -> Lis
         return [[value for value in line] for line in text.splitlines()]
 
 
+@profiled()
 def unspaced_text_to_2d_array(text: str, dtype: Optional[Callable] = None) -> np.ndarray:
     """Convert a string with newlines to a numpy array with one element per character in the string."""
     return np.array(unspaced_text_to_2d_list(text, dtype))
+
+
+@profiled()
+def text_to_byte_grid(text: Text, subtract: Optional[str] = None) -> np.ndarray:
+    """
+    Convert an unspaced character map to a 2D uint8 array of its bytes.
+
+    The bytes are wrapped by a single strided numpy view that skips the newlines, so no object is made per
+    character and all lines must have the same length. Without subtract the result is a read-only view,
+    use subtract="0" to decode digits or subtract="a" to decode lowercase letters to 0-25.
+    """
+    data = np.frombuffer(text.encode() if isinstance(text, str) else text, dtype=np.uint8)
+    width = _find_first_newline(data)
+    stride = width + 1
+    # The last newline is optional, every other line has to end exactly one stride after the previous one
+    size = len(data) - int(len(data) > 0 and data[-1] == ord("\n"))
+    n_rows, remainder = divmod(size + 1, stride)
+    if width == 0 or remainder or (data[width:size:stride] != ord("\n")).any():
+        raise ValueError("All lines of a character map should be non-empty and have the same length")
+    grid: np.ndarray = np.ndarray((n_rows, width), dtype=np.uint8, buffer=data, strides=(stride, 1))
+    if subtract is not None:
+        grid = grid - np.uint8(ord(subtract))
+    return grid
+
+
+def _find_first_newline(data: np.ndarray) -> int:
+    """Find the first newline in a byte array, looking at a growing prefix so short lines stay cheap."""
+    size = 256
+    while True:
+        index = data[:size].tobytes().find(b"\n")
+        if index >= 0:
+            return index
+        if size >= len(data):
+            return len(data)
+        size *= 2
@@ -0,0 +1,185 @@
+"""Measure the wall time, allocations and calls of the named phases of a solution, e.g. parse and search.
+
+Phases are marked with the phase context manager or the profiled decorator. Nothing is measured unless a
+solution is run through solve_profiled with profiling switched on, so marking phases costs next to nothing.
+Allocations are traced with tracemalloc, which slows everything down, so compare the times relative to each other.
+"""
+import argparse
+import cProfile
+import functools
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+Func = TypeVar("Func", bound=Callable[..., Any])
+
+
+@dataclass
+class PhaseStats:
+    """Totals over all calls of a phase, memory is in bytes traced by tracemalloc."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    net_bytes: int = 0
+    peak_bytes: int = 0
+
+
+@dataclass
+class _Frame:
+    """A phase that is running, memory is the absolute traced memory."""
+
+    name: str
+    start_time: float
+    start_bytes: int
+    peak_bytes: int
+
+
+@dataclass
+class Profiler:
+    """Collect the stats per phase while enabled, optionally running cProfile during one of the phases."""
+
+    enabled: bool = False
+    stats: Dict[str, PhaseStats] = field(default_factory=dict)
+    cprofile_phase: Optional[str] = None
+    cprofile: Optional[cProfile.Profile] = None
+    _frames: List[_Frame] = field(default_factory=list)
+
+    def enter(self, name: str) -> None:
+        """Start measuring a phase."""
+        current, peak = tracemalloc.get_traced_memory()
+        if self._frames:
+            # The peak is reset for this phase, so pass the peak so far to the enclosing phase first
+            self._frames[-1].peak_bytes = max(self._frames[-1].peak_bytes, peak)
+        tracemalloc.reset_peak()
+        self._frames.append(_Frame(name, time.perf_counter(), current, current))
+        if name == self.cprofile_phase and self.cprofile is not None and self._depth(name) == 1:
+            self.cprofile.enable()
+
+    def exit(self) -> None:
+        """Stop measuring the innermost phase and add its measurements to the stats."""
+        frame = self._frames[-1]
+        if frame.name == self.cprofile_phase and self.cprofile is not None and self._depth(frame.name) == 1:
+            self.cprofile.disable()
+        duration = time.perf_counter() - frame.start_time
+        current, peak = tracemalloc.get_traced_memory()
+        frame.peak_bytes = max(frame.peak_bytes, peak)
+        self._frames.pop()
+        if self._frames:
+            self._frames[-1].peak_bytes = max(self._frames[-1].peak_bytes, frame.peak_bytes)
+
+        stats = self.stats.setdefault(frame.name, PhaseStats())
+        stats.calls += 1
+        # Recursive phases are timed once, by their outermost call
+        if self._depth(frame.name) == 0:
+            stats.seconds += duration
+        stats.net_bytes += current - frame.start_bytes
+        stats.peak_bytes = max(stats.peak_bytes, frame.peak_bytes - frame.start_bytes)
+
+    def _depth(self, name: str) -> int:
+        """Count how many times a phase is on the stack of running phases."""
+        return sum(frame.name == name for frame in self._frames)
+
+
+PROFILER = Profiler()
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Measure the code in the with block as a named phase when profiling is enabled."""
+    if not PROFILER.enabled:
+        yield
+        return
+    PROFILER.enter(name)
+    try:
+        yield
+    finally:
+        PROFILER.exit()
+
+
+def profiled(name: Optional[str] = None) -> Callable[[Func], Func]:
+    """Measure every call of the decorated function as a phase, named after the function by default."""
+
+    def decorator(func: Func) -> Func:
+        phase_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            PROFILER.enter(phase_name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.exit()
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def format_stats(stats: Dict[str, PhaseStats]) -> str:
+    """Format the phase stats as a table, the slowest phases first."""
+    total = max((phase_stats.seconds for phase_stats in stats.values()), default=0.0) or 1.0
+    rows = [f"{'phase':<24} {'calls':>8} {'seconds':>9} {'%':>6} {'net MB':>8} {'peak MB':>8}"]
+    for name, phase_stats in sorted(stats.items(), key=lambda item: -item[1].seconds):
+        rows.append(
+            f"{name:<24} {phase_stats.calls:>8} {phase_stats.seconds:>9.4f} {phase_stats.seconds / total * 100:>6.1f} "
+            f"{phase_stats.net_bytes / 1e6:>8.2f} {phase_stats.peak_bytes / 1e6:>8.2f}"
+        )
+    return "\n".join(rows)
+
+
+def hot_phase(stats: Dict[str, PhaseStats]) -> str:
+    """Return the slowest phase below the solve phase, or solve itself when no other phases were marked."""
+    inner = {name: phase_stats for name, phase_stats in stats.items() if name != "solve"}
+    return max(inner, key=lambda name: inner[name].seconds) if inner else "solve"
+
+
+def _run(solve: Callable[[Any], Any], text: Any) -> Any:
+    """Run solve as the outermost phase with profiling enabled."""
+    PROFILER.stats = {}
+    PROFILER.enabled = True
+    tracemalloc.start()
+    try:
+        with phase("solve"):
+            return solve(text)
+    finally:
+        tracemalloc.stop()
+        PROFILER.enabled = False
+
+
+def solve_profiled(solve: Callable[[Any], Any], text: Any, profile: Optional[str] = None) -> Any:
+    """
+    Return solve(text), printing the time and memory per phase when profile is given.
+
+    When profile is a path, solve runs a second time with cProfile switched on during the slowest phase and the
+    pstats are written to that path. Without profile, solve is called as is.
+    """
+    if profile is None:
+        return solve(text)
+    solution = _run(solve, text)
+    print(format_stats(PROFILER.stats))
+
+    if profile:
+        PROFILER.cprofile_phase = hot_phase(PROFILER.stats)
+        PROFILER.cprofile = cProfile.Profile()
+        try:
+            _run(solve, text)
+        finally:
+            PROFILER.cprofile.dump_stats(profile)
+            print(f"cProfile of phase {PROFILER.cprofile_phase} written to {profile}")
+            PROFILER.cprofile_phase, PROFILER.cprofile = None, None
+    return solution
+
+
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the --profile option of solve_profiled to the arguments of a solution."""
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="PSTATS_FILE",
+        help="print time and memory per phase, with a file also write a cProfile of the slowest phase to it",
+    )
@@ -0,0 +1,174 @@
+"""Keep solutions loaded in a warm process that solves tasks sent to it over a Unix socket.
+
+Requests and responses are JSON objects, one per line. A request names the part file of a task, e.g.
+{"year": 2021, "day": 9, "part": 2, "path": "/repo/2021/y_2021_day_09/part_2.py"}, and the response is the result
+of the task as written by aoc run --json, with anything the solution printed and whether it was reloaded. Only part
+files that were found when the server started are run, and only the user that started it can use the socket.
+
+Part files are imported again when they changed since they were loaded. When a module of the aoc package changed, it
+is reloaded with importlib.reload together with the other aoc modules and all part files, since they hold references
+to the old functions.
+"""
+import contextlib
+import importlib
+import io
+import json
+import os
+import socket
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from aoc.cli import Result, Task, discover, load_solver, run_task
+
+SOCKET_PATH = Path(os.environ.get("XDG_RUNTIME_DIR", "/tmp")) / f"aoc-{os.getuid()}.sock"
+# Packages that the solutions use, imported once when the server starts
+PRELOAD = ("numpy", "scipy.ndimage", "aoc.compute", "aoc.inputs", "aoc.parsers")
+# The modules that run the server itself are never reloaded
+NOT_RELOADED = ("aoc", "aoc.cli", "aoc.serve")
+
+
+def _mtime(module: ModuleType) -> Optional[int]:
+    """Return the modification time of the source of a module, or None when it has no file."""
+    try:
+        return os.stat(module.__file__).st_mtime_ns if module.__file__ else None
+    except OSError:
+        return None
+
+
+@dataclass
+class WarmSolvers:
+    """Part file modules and the aoc modules they use, kept up to date with their source files."""
+
+    solvers: Dict[Task, Tuple[ModuleType, Optional[int]]] = field(default_factory=dict)
+    helpers: Dict[str, Optional[int]] = field(default_factory=dict)
+    # The preloaded tasks by the resolved path of their part file, requests for other files are refused
+    tasks: Dict[Path, Task] = field(default_factory=dict)
+
+    def preload(self, tasks: Iterable[Task]) -> None:
+        """Import the common packages and the part files of the tasks, part files that fail are skipped."""
+        for name in PRELOAD:
+            with contextlib.suppress(ImportError):
+                importlib.import_module(name)
+        for task in tasks:
+            self.tasks[task.path.resolve()] = task
+            with contextlib.suppress(Exception):
+                self.solver(task)
+        self._track_helpers()
+
+    def known_task(self, path: Path) -> Optional[Task]:
+        """Return the preloaded task of a part file, or None when the server did not find it at startup."""
+        return self.tasks.get(path.resolve())
+
+    def _track_helpers(self) -> None:
+        """Store the modification times of the aoc modules that were imported since the last call."""
+        for name, module in list(sys.modules.items()):
+            if name.startswith("aoc.") and name not in NOT_RELOADED and name not in self.helpers:
+                self.helpers[name] = _mtime(module)
+
+    def reload_helpers(self) -> bool:
+        """Reload all aoc modules when one of them changed, return if they were reloaded."""
+        if all(_mtime(sys.modules[name]) == mtime for name, mtime in self.helpers.items()):
+            return False
+        # A module is added to sys.modules before the modules it imports, so reversed they come before their users
+        for name in reversed(list(self.helpers)):
+            importlib.reload(sys.modules[name])
+        self.solvers.clear()
+        self.helpers.clear()
+        self._track_helpers()
+        return True
+
+    def solver(self, task: Task) -> Tuple[ModuleType, bool]:
+        """Return the module of a part file, and if it was imported again because it changed."""
+        mtime = os.stat(task.path).st_mtime_ns
+        loaded = self.solvers.get(task)
+        if loaded is not None and loaded[1] == mtime:
+            return loaded[0], False
+        self.solvers[task] = (load_solver(task), mtime)
+        return self.solvers[task][0], loaded is not None
+
+    def solve(self, task: Task, input_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Solve a task with its warm module and return the result as a dict."""
+        stdout = io.StringIO()
+        reloaded = False
+        try:
+            reloaded = self.reload_helpers()
+            module, reloaded_solver = self.solver(task)
+        except Exception as error:
+            result = Result(task, error=f"{type(error).__name__}: {error}")
+        else:
+            reloaded = reloaded or reloaded_solver
+            with contextlib.redirect_stdout(stdout):
+                result = run_task(task, module, input_path)
+            self._track_helpers()
+        return {**result.to_dict(), "stdout": stdout.getvalue(), "reloaded": reloaded}
+
+
+def _handle(solvers: WarmSolvers, line: bytes) -> Dict[str, Any]:
+    """Solve the task of a request line, requests that can not be read get an error."""
+    try:
+        request = json.loads(line)
+        path = Path(request["path"])
+        input_path = Path(request["input"]) if request.get("input") else None
+    except (ValueError, KeyError, TypeError) as error:
+        return {"error": f"Bad request: {type(error).__name__}: {error}"}
+    # Never import a file just because a request names it
+    task = solvers.known_task(path)
+    if task is None:
+        return {"error": f"Bad request: {path} is not a part file of the server"}
+    return solvers.solve(task, input_path)
+
+
+def _bind(socket_path: Path) -> socket.socket:
+    """Listen on the socket path, replacing the socket of a server that is no longer running."""
+    if socket_path.exists():
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            if probe.connect_ex(str(socket_path)) == 0:
+                raise OSError(f"A server is already listening on {socket_path}")
+        socket_path.unlink()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    # Connecting needs write permission, the umask might have left it to other users
+    os.chmod(socket_path, 0o600)
+    server.listen()
+    return server
+
+
+def serve(root: Path, socket_path: Path = SOCKET_PATH, max_connections: Optional[int] = None) -> None:
+    """
+    Preload the part files under root and solve the requests sent to the socket, one connection at a time.
+
+    A connection can send any number of requests. The server stops after max_connections, or when interrupted.
+    """
+    solvers = WarmSolvers()
+    solvers.preload(discover(root))
+    server = _bind(socket_path)
+    print(f"Serving {len(solvers.solvers)} parts on {socket_path}", flush=True)
+    try:
+        n_connections = 0
+        while max_connections is None or n_connections < max_connections:
+            connection, _ = server.accept()
+            n_connections += 1
+            with connection, connection.makefile("rwb") as stream:
+                for line in stream:
+                    stream.write(json.dumps(_handle(solvers, line)).encode() + b"\n")
+                    stream.flush()
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
+
+
+def solve_remote(tasks: Iterable[Task], socket_path: Path = SOCKET_PATH) -> Iterator[Result]:
+    """Send tasks to a running server and yield their results, printing what the solutions printed."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        with client.makefile("rwb") as stream:
+            for task in tasks:
+                request = {"year": task.year, "day": task.day, "part": task.part, "path": str(task.path.absolute())}
+                stream.write(json.dumps(request).encode() + b"\n")
+                stream.flush()
+                response = json.loads(stream.readline())
+                print(response.get("stdout", ""), end="")
+                yield Result(task, response.get("answer"), response.get("seconds", 0.0), response.get("error"))
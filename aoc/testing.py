@@ -0,0 +1,18 @@
+"""Test helpers for the inline tests of the solutions, without importing pytest when a solution is only run."""
+import sys
+from typing import Any, Callable, Iterable, Sequence, TypeVar, Union
+
+Func = TypeVar("Func", bound=Callable[..., Any])
+
+
+def parametrize(argnames: Union[str, Sequence[str]], argvalues: Iterable[Any]) -> Callable[[Func], Func]:
+    """
+    Return pytest.mark.parametrize when pytest is running, otherwise return the test as is.
+
+    Pytest is always imported before it collects the tests, so the mark is only missing when nothing runs the tests.
+    """
+    pytest = sys.modules.get("pytest")
+    if pytest is None:
+        return lambda func: func
+    mark: Callable[[Func], Func] = pytest.mark.parametrize(argnames, argvalues)
+    return mark
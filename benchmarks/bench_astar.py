@@ -0,0 +1,39 @@
+"""Compare nodes expanded and wall time of A* against Dijkstra on a generated risk map.
+
+Run from the repo root:
+python benchmarks/bench_astar.py --size 300 --max-risk 3
+"""
+import argparse
+import time
+
+import numpy as np
+from bench_grid_dijkstra import build_graph
+
+from aoc.compute import astar, chebyshev, manhattan
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=300, help="width and height of the generated grid")
+    parser.add_argument("--max-risk", type=int, default=9, help="cells get a risk between 1 and this value")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    grid = np.random.default_rng(args.seed).integers(1, args.max_risk + 1, size=(args.size, args.size))
+    graph = build_graph(grid)
+    goal = (args.size - 1, args.size - 1)
+
+    print(f"{args.size}x{args.size} grid with risks 1-{args.max_risk}")
+    print(f"{'':>10} {'cost':>8} {'expanded':>10} {'seconds':>9}")
+    # Dijkstra is A* without a heuristic
+    for name, heuristic in (("dijkstra", lambda node, goal: 0), ("manhattan", manhattan), ("chebyshev", chebyshev)):
+        start = time.perf_counter()
+        _, node_costs, n_expanded = astar(graph, (0, 0), goal, heuristic)
+        duration = time.perf_counter() - start
+        print(f"{name:>10} {node_costs[goal]:8} {n_expanded:10} {duration:9.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
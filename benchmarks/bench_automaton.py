@@ -0,0 +1,60 @@
+"""Compare the set based and the array based cellular automata on random patterns of several densities.
+
+Run from the repo root:
+python benchmarks/bench_automaton.py --size 200 --generations 100
+python benchmarks/bench_automaton.py --density 0.001 0.01 --neighbourhood hex
+"""
+import argparse
+import time
+from typing import Dict, List, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from aoc.automaton import HEX, LIFE, Coord, DenseAutomaton, Rule, SparseAutomaton, moore
+
+# Hex tiles like y_2020_day_24 and Conway's game of life
+RULES: Dict[str, Tuple[Sequence[Coord], Rule]] = {
+    "hex": (HEX, Rule(frozenset({2}), frozenset({1, 2}))),
+    "moore": (moore(), LIFE),
+}
+
+
+def time_automaton(
+    cls: Union[Type[SparseAutomaton], Type[DenseAutomaton]], cells: List[Coord], name: str, generations: int
+) -> Tuple[float, int]:
+    """Return the seconds it takes to run the generations and the number of live cells at the end."""
+    neighbourhood, rule = RULES[name]
+    automaton = cls.from_cells(cells, neighbourhood, rule)
+    start = time.perf_counter()
+    automaton.run(generations)
+    return time.perf_counter() - start, len(automaton)
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=200, help="side of the square the random cells start in")
+    parser.add_argument("--density", type=float, nargs="+", default=[0.01, 0.05, 0.2, 0.5])
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--neighbourhood", choices=sorted(RULES), nargs="+", default=sorted(RULES))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'':>6} {'density':>8} {'cells':>8} {'sparse s':>9} {'dense s':>9} {'speedup':>8} {'live':>8}")
+    for name in args.neighbourhood:
+        for density in args.density:
+            cells = [tuple(cell) for cell in np.argwhere(rng.random((args.size, args.size)) < density).tolist()]
+            sparse_seconds, n_live = time_automaton(SparseAutomaton, cells, name, args.generations)
+            dense_seconds, n_dense_live = time_automaton(DenseAutomaton, cells, name, args.generations)
+            assert n_live == n_dense_live
+            print(
+                f"{name:>6} {density:8.3f} {len(cells):8} {sparse_seconds:9.4f} {dense_seconds:9.4f} "
+                f"{sparse_seconds / dense_seconds:7.2f}x {n_live:8}",
+                flush=True,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
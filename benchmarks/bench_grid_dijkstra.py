@@ -0,0 +1,78 @@
+"""Compare the adjacency dict Dijkstra with the array-backed grid Dijkstra.
+
+Run from the repo root:
+python benchmarks/bench_grid_dijkstra.py --size 500
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+from aoc.compute import Coord, dijkstra, grid_dijkstra
+
+
+def build_graph(grid: np.ndarray) -> Dict[Coord, Dict[Coord, int]]:
+    """Build the adjacency dict the way y_2021_day_15 used to."""
+    list_2d = grid.tolist()
+    graph: Dict[Coord, Dict[Coord, int]] = {}
+    for y, row in enumerate(list_2d):
+        for x, _ in enumerate(row):
+            graph[(x, y)] = {}
+            if x > 0:
+                graph[(x, y)][(x - 1, y)] = row[x - 1]
+            if x + 1 < len(row):
+                graph[(x, y)][(x + 1, y)] = row[x + 1]
+            if y > 0:
+                graph[(x, y)][(x, y - 1)] = list_2d[y - 1][x]
+            if y + 1 < len(list_2d):
+                graph[(x, y)][(x, y + 1)] = list_2d[y + 1][x]
+    return graph
+
+
+def measure(func: Callable[..., Any], *args: Any) -> Tuple[Any, float, int]:
+    """Return the result, wall time in seconds and peak traced memory in bytes of a call.
+
+    Time and memory are measured in separate runs since tracing allocations slows the call down.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    duration = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, duration, peak
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=500, help="width and height of the generated grid")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    grid = np.random.default_rng(args.seed).integers(1, 10, size=(args.size, args.size))
+    end = (args.size - 1, args.size - 1)
+
+    graph, build_time, build_peak = measure(build_graph, grid)
+    (_, dict_costs), dict_time, dict_peak = measure(dijkstra, graph, (0, 0))
+    (_, target_costs), target_time, target_peak = measure(dijkstra, graph, (0, 0), {end})
+    del graph
+    (_, grid_costs), grid_time, grid_peak = measure(grid_dijkstra, grid, (0, 0))
+    (_, grid_target_costs), grid_target_time, grid_target_peak = measure(grid_dijkstra, grid, (0, 0), {end})
+    assert dict_costs[end] == target_costs[end] == grid_costs[-1, -1] == grid_target_costs[-1, -1]
+
+    print(f"{args.size}x{args.size} grid, end cost {grid_costs[-1, -1]}")
+    print(f"{'':>14} {'build s':>9} {'search s':>9} {'peak MB':>9}")
+    print(f"{'dict':>14} {build_time:9.3f} {dict_time:9.3f} {(build_peak + dict_peak) / 1e6:9.1f}")
+    print(f"{'dict, target':>14} {build_time:9.3f} {target_time:9.3f} {(build_peak + target_peak) / 1e6:9.1f}")
+    print(f"{'grid':>14} {0.0:9.3f} {grid_time:9.3f} {grid_peak / 1e6:9.1f}")
+    print(f"{'grid, target':>14} {0.0:9.3f} {grid_target_time:9.3f} {grid_target_peak / 1e6:9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
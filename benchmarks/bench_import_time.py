@@ -0,0 +1,86 @@
+"""Measure the cold start of every solution, the time it takes to import the part file and everything it imports.
+
+Every part is imported in a fresh interpreter with python -X importtime, the modules the interpreter imports on its
+own are left out. The best of the repeats is reported, together with the heavy third party packages that got
+imported and the slowest top level imports.
+
+Run from the repo root:
+python benchmarks/bench_import_time.py --year 2021
+python benchmarks/bench_import_time.py --year 2021 --day 9 --part 2 --repeats 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from aoc.cli import add_filter_arguments, discover
+
+HEAVY_PACKAGES = ("numpy", "scipy", "pytest", "aocd")
+IMPORT_PART_S = "import runpy, sys; runpy.run_path(sys.argv[1])"
+
+
+def import_times(path: Path) -> List[Tuple[int, str, int]]:
+    """Import a file in a new interpreter and return the nesting depth, name and cumulative microseconds of imports."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_PART_S, str(path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = []
+    # Lines look like "import time:  self [us] | cumulative | imported package", nested imports are indented
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            imports.append((depth, name.strip(), int(cumulative)))
+    return imports
+
+
+def measure(path: Path, startup: Set[str], repeats: int) -> Tuple[float, Dict[str, int], Set[str]]:
+    """
+    Return the lowest import time in ms over the repeats, with the top level and all imports of that run.
+
+    Modules in startup are imported by the interpreter itself and are left out.
+    """
+    runs = []
+    for _ in range(repeats):
+        imports = [(depth, name, us) for depth, name, us in import_times(path) if name not in startup]
+        top_level = {name: us for depth, name, us in imports if depth == 0}
+        runs.append((sum(top_level.values()) / 1000, top_level, {name for _, name, _ in imports}))
+    return min(runs, key=lambda run: run[0])
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    add_filter_arguments(parser)
+    parser.add_argument("--repeats", type=int, default=3, help="imports per part, the fastest one is reported")
+    parser.add_argument("--top", type=int, default=3, help="number of slowest top level imports to show")
+    args = parser.parse_args()
+
+    # The empty file gives the imports of the interpreter itself and of runpy
+    startup = {name for _, name, _ in import_times(Path(os.devnull))}
+
+    totals: List[float] = []
+    print(f"{'':>24} {'import ms':>9}  {'heavy packages':<28} slowest imports")
+    for task in discover(args.root, args.year, args.day, args.part):
+        milliseconds, imports, modules = measure(task.path, startup, args.repeats)
+        totals.append(milliseconds)
+        heavy = ",".join(
+            package for package in HEAVY_PACKAGES if any(name.split(".")[0] == package for name in modules)
+        )
+        slowest = sorted(imports, key=lambda name: -imports[name])[: args.top]
+        slowest_s = ", ".join(f"{name} {imports[name] / 1000:.0f}" for name in slowest)
+        print(f"{task.name:>24} {milliseconds:9.1f}  {heavy:<28} {slowest_s}", flush=True)
+    if totals:
+        print(f"{len(totals)} parts, mean {sum(totals) / len(totals):.1f} ms, max {max(totals):.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,99 @@
+"""Compare the memory of reading inputs into a str with memory-mapping them for the 2021 grid days.
+
+Every run happens in a fresh process that reports its peak RSS and how much of its resident memory is anonymous,
+i.e. private to the process, or file backed, i.e. page cache that concurrent runs on the same input share.
+
+Run from the repo root:
+python benchmarks/bench_input_rss.py --repeat 50
+"""
+import argparse
+import importlib.util
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from aoc.inputs import map_input
+
+REPO_ROOT = Path(__file__).parent.parent
+DAYS = ("2021/y_2021_day_03/part_1.py", "2021/y_2021_day_09/part_1.py", "2021/y_2021_day_15/part_1.py")
+
+
+def rss_status() -> Dict[str, int]:
+    """Read the current anonymous and file backed resident memory in kB from /proc."""
+    status = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("RssAnon", "RssFile"):
+                status[key] = int(value.split()[0])
+    return status
+
+
+def run_child(part_file: str, data_file: str, loader: str) -> Dict[str, Any]:
+    """Load the input and solve it in this process, return the answer and memory use."""
+    spec = importlib.util.spec_from_file_location("part", REPO_ROOT / part_file)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    start = time.perf_counter()
+    if loader == "read":
+        with open(data_file) as f:
+            text: Any = f.read()
+    else:
+        text = map_input(data_file)
+    answer = module.solve(text)
+    duration = time.perf_counter() - start
+    # ru_maxrss is in kB on Linux
+    return {
+        "answer": answer,
+        "seconds": duration,
+        "peak": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        **rss_status(),
+    }
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=50, help="repeat the input lines to scale it up")
+    parser.add_argument("--child", nargs=3, metavar=("PART_FILE", "DATA_FILE", "LOADER"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(*args.child)))
+        return 0
+
+    print(f"{'':>28} {'loader':>6} {'MB':>6} {'peak MB':>8} {'anon MB':>8} {'file MB':>8} {'seconds':>8}")
+    for part_file in DAYS:
+        # Stacking the map on itself keeps it a valid input for all of these days
+        lines = (REPO_ROOT / part_file).with_name("input.txt").read_text().splitlines(keepends=True)
+        with tempfile.NamedTemporaryFile("w", suffix=".txt") as data_file:
+            data_file.write("".join(lines * args.repeat))
+            data_file.flush()
+            size = Path(data_file.name).stat().st_size
+            answers = set()
+            for loader in ("read", "mmap"):
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", part_file, data_file.name, loader],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                result = json.loads(output)
+                answers.add(result["answer"])
+                print(
+                    f"{part_file:>28} {loader:>6} {size / 1e6:6.1f} {result['peak'] / 1e3:8.1f} "
+                    f"{result['RssAnon'] / 1e3:8.1f} {result['RssFile'] / 1e3:8.1f} {result['seconds']:8.3f}"
+                )
+            assert len(answers) == 1, answers
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
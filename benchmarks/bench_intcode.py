@@ -0,0 +1,47 @@
+"""Measure the intcode VM speed in instructions per second.
+
+Run from the repo root:
+python benchmarks/bench_intcode.py --loops 1000000
+"""
+import argparse
+import time
+from typing import List
+
+from aoc.compute import IntcodeVM
+
+
+def countdown_program(loops: int) -> List[int]:
+    """Build a program that counts a memory cell down to zero, every loop runs an add and a jump."""
+    counter = 100
+    code = [
+        # mem[counter] = -1 + mem[counter]
+        101,
+        -1,
+        counter,
+        counter,
+        # if mem[counter] != 0: jump to 0
+        1005,
+        counter,
+        0,
+        99,
+    ]
+    code += [0] * (counter - len(code)) + [loops]
+    return code
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--loops", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    vm = IntcodeVM(countdown_program(args.loops))
+    start = time.perf_counter()
+    vm.run()
+    duration = time.perf_counter() - start
+    print(f"{vm.n_instructions} instructions in {duration:.3f} s: {vm.n_instructions / duration / 1e6:.2f}M per second")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
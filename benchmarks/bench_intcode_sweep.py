@@ -0,0 +1,110 @@
+"""Time the 100x100 noun/verb sweep with fresh VMs, snapshot restores and a process pool.
+
+Run from the repo root:
+python benchmarks/bench_intcode_sweep.py
+"""
+import argparse
+import itertools
+import os
+import random
+import time
+from typing import List, Optional, Tuple
+
+from aoc.compute import IntcodeVM
+from aoc.parallel import sweep
+
+
+def noun_verb_program(seed: int = 0, n_instructions: int = 40) -> List[int]:
+    """
+    Build a program shaped like 2019 day 2.
+
+    The first instruction adds the values at the noun and verb addresses, the following ones add or multiply
+    the running result with constants and the result ends up in address 0.
+    """
+    rng = random.Random(seed)
+    n_constants = 100
+    code = [1, 0, 0, 3]
+    constants_start = 4 * (n_instructions + 2) + 1
+    for _ in range(n_instructions):
+        opcode = 2 if rng.random() < 0.1 else 1
+        code += [opcode, 3, constants_start + rng.randrange(n_constants), 3]
+    # Copy the result to address 0, the constant at constants_start is 0
+    code += [1, 3, constants_start, 0, 99]
+    code += [0] + [rng.randint(1, 3) for _ in range(n_constants - 1)]
+    return code
+
+
+def sweep_fresh(code: List[int], target: int) -> Tuple[Optional[Tuple[int, int]], int]:
+    """Search the noun and verb by building a new VM from the program for every pair."""
+    n_runs = 0
+    for noun in range(100):
+        for verb in range(100):
+            program = code[:]
+            program[1], program[2] = noun, verb
+            vm = IntcodeVM(program)
+            vm.run()
+            n_runs += 1
+            if vm.memory[0] == target:
+                return (noun, verb), n_runs
+    return None, n_runs
+
+
+def sweep_snapshot(code: List[int], target: int) -> Tuple[Optional[Tuple[int, int]], int]:
+    """Search the noun and verb on a single VM that is restored from a snapshot for every pair."""
+    vm = IntcodeVM(code)
+    snapshot = vm.snapshot()
+    n_runs = 0
+    for noun in range(100):
+        for verb in range(100):
+            vm.restore(snapshot)
+            vm.write(1, noun)
+            vm.write(2, verb)
+            vm.run()
+            n_runs += 1
+            if vm.memory[0] == target:
+                return (noun, verb), n_runs
+    return None, n_runs
+
+
+def run_noun_verb(code: List[int], noun_verb: Tuple[int, int]) -> int:
+    """Run the program for one noun and verb pair and return address 0."""
+    program = code[:]
+    program[1], program[2] = noun_verb
+    vm = IntcodeVM(program)
+    vm.run()
+    return vm.memory[0]
+
+
+def sweep_parallel(code: List[int], target: int, max_workers: int) -> Tuple[Optional[Tuple[int, int]], int]:
+    """Search the noun and verb over a process pool, the program is shipped once per worker."""
+    pairs = list(itertools.product(range(100), range(100)))
+    hit = sweep(run_noun_verb, pairs, lambda result: result == target, payload=code, max_workers=max_workers)
+    return (hit[0] if hit else None), len(pairs)
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes for the parallel sweep")
+    args = parser.parse_args()
+
+    code = noun_verb_program(args.seed)
+    # Aim for a target that is not hit before the last pair, so the full sweep is timed
+    target = -1
+
+    print(f"program of {len(code)} ints, sweeping 100x100 noun/verb pairs")
+    for name, search in (
+        ("fresh VM", sweep_fresh),
+        ("snapshot", sweep_snapshot),
+        (f"{args.workers} procs", lambda code, target: sweep_parallel(code, target, args.workers)),
+    ):
+        start = time.perf_counter()
+        _, n_runs = search(code, target)
+        duration = time.perf_counter() - start
+        print(f"{name:>10}: {n_runs} runs in {duration:.3f} s, {duration / n_runs * 1e6:.1f} us per run")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
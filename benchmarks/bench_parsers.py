@@ -0,0 +1,56 @@
+"""Compare the bulk numpy parsers with parsing through a list of Python objects.
+
+Run from the repo root:
+python benchmarks/bench_parsers.py --n-values 10000000 --grid-size 3000
+"""
+import argparse
+import time
+from typing import Any, Callable
+
+import numpy as np
+
+from aoc.parsers import (
+    comma_separated_text_to_integer_array,
+    text_to_byte_grid,
+    text_to_integer_array,
+    unspaced_text_to_2d_array,
+)
+
+
+def timed(func: Callable[..., Any], *args: Any) -> float:
+    """Return the wall time of a call in seconds."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n-values", type=int, default=10_000_000)
+    parser.add_argument("--grid-size", type=int, default=3000, help="width and height of the digit map")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    values = np.random.default_rng(args.seed).integers(0, 1_000_000, args.n_values)
+    lines = "\n".join(map(str, values.tolist())) + "\n"
+    commas = ",".join(map(str, values.tolist())) + "\n"
+
+    print(f"{args.n_values} integers")
+    list_time = timed(lambda text: np.array([int(line) for line in text.splitlines()]), lines)
+    print(f"{'lines, list of ints':>24}: {list_time:.3f} s")
+    print(f"{'lines, bulk':>24}: {timed(text_to_integer_array, lines):.3f} s")
+    list_time = timed(lambda text: np.array([int(x) for x in text.split(",")]), commas)
+    print(f"{'commas, list of ints':>24}: {list_time:.3f} s")
+    print(f"{'commas, bulk':>24}: {timed(comma_separated_text_to_integer_array, commas):.3f} s")
+
+    digits = np.random.default_rng(args.seed).integers(0, 10, (args.grid_size, args.grid_size))
+    grid_text = "\n".join("".join(map(str, row)) for row in digits.tolist()) + "\n"
+    print(f"{args.grid_size}x{args.grid_size} digit map")
+    print(f"{'map, list of ints':>24}: {timed(unspaced_text_to_2d_array, grid_text, int):.3f} s")
+    print(f"{'map, byte grid':>24}: {timed(text_to_byte_grid, grid_text, '0'):.3f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,121 @@
+"""Time every solve on its input.txt or a generated input and compare the timings with a stored baseline.
+
+Every part gets warmup runs that are not timed, followed by repeated timed runs summarised by their median and
+interquartile range. Store a baseline on one commit and compare against it on another, the exit code is 1 when a
+part got slower than the baseline median by more than the threshold.
+
+Run from the repo root:
+python benchmarks/bench_solutions.py --year 2021 --save-baseline
+python benchmarks/bench_solutions.py --year 2021 --threshold 10
+python benchmarks/bench_solutions.py --year 2021 --day 15 --size 100 200 400
+"""
+import argparse
+import itertools
+import json
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from aoc.cli import Task, add_filter_arguments, discover, load_solver
+from aoc.gen import get_generator
+
+BASELINE_JSON = Path(__file__).parent / "baseline.json"
+
+
+@dataclass
+class Timing:
+    """Summary of the timed runs of a part in seconds."""
+
+    median: float
+    q1: float
+    q3: float
+    repeats: int
+
+    @property
+    def iqr(self) -> float:
+        """Return the interquartile range."""
+        return self.q3 - self.q1
+
+
+def time_solve(solve: Callable[[str], Any], text: str, warmup: int, repeats: int) -> Timing:
+    """Call solve warmup times without timing, then time it repeats times."""
+    for _ in range(warmup):
+        solve(text)
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        solve(text)
+        durations.append(time.perf_counter() - start)
+    if repeats == 1:
+        return Timing(durations[0], durations[0], durations[0], 1)
+    q1, median, q3 = statistics.quantiles(durations, n=4, method="inclusive")
+    return Timing(median, q1, q3, repeats)
+
+
+def is_regression(timing: Timing, baseline: Optional[Dict[str, float]], threshold: float, min_seconds: float) -> bool:
+    """Check if the median got slower than the baseline median by more than threshold percent and min_seconds."""
+    if baseline is None:
+        return False
+    slowdown = timing.median - baseline["median"]
+    return slowdown > min_seconds and slowdown > baseline["median"] * threshold / 100
+
+
+def benchmark(task: Task, args: argparse.Namespace, size: Optional[int]) -> Timing:
+    """Time the solve function of a task on its input, or on a generated input of the given size."""
+    solve = load_solver(task).solve
+    if size is None:
+        text = task.input_path.read_text()
+    else:
+        text = get_generator(task.year, task.day)(size, seed=args.seed)
+    return time_solve(solve, text, args.warmup, args.repeats)
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    add_filter_arguments(parser)
+    parser.add_argument("--size", type=int, nargs="+", help="time generated inputs of these sizes instead")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated inputs")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before the timed ones")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per part")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_JSON, help="JSON file with baseline timings")
+    parser.add_argument("--save-baseline", action="store_true", help="store the timings as the new baseline")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percentage slowdown that fails the run")
+    parser.add_argument("--min-seconds", type=float, default=0.001, help="ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    baselines: Dict[str, Dict[str, float]] = {}
+    if args.baseline.exists():
+        baselines = json.loads(args.baseline.read_text())
+
+    regressions: List[str] = []
+    timings: Dict[str, Dict[str, float]] = {}
+    print(f"{'':>28} {'median s':>9} {'IQR s':>9} {'baseline':>9} {'change':>8}")
+    for task, size in itertools.product(discover(args.root, args.year, args.day, args.part), args.size or [None]):
+        timing = benchmark(task, args, size)
+        name = task.name if size is None else f"{task.name}_n{size}"
+        timings[name] = asdict(timing)
+        baseline = baselines.get(name)
+        change = ""
+        if baseline is not None:
+            change = f"{(timing.median / baseline['median'] - 1) * 100:+7.1f}%"
+        if is_regression(timing, baseline, args.threshold, args.min_seconds):
+            regressions.append(name)
+            change += " REGRESSION"
+        baseline_s = f"{baseline['median']:9.4f}" if baseline is not None else f"{'':>9}"
+        print(f"{name:>28} {timing.median:9.4f} {timing.iqr:9.4f} {baseline_s} {change}", flush=True)
+
+    if args.save_baseline:
+        baselines.update(timings)
+        args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"Saved {len(timings)} timings to {args.baseline}")
+    if regressions:
+        print(f"{len(regressions)} parts are more than {args.threshold}% slower than the baseline: {regressions}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
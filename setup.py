@@ -12,4 +12,5 @@ setup(
     author="Jeroen Boeye",
     author_email="j.boeye@faktion.com",
     description="Advent of code helper functions.",
+    entry_points={"console_scripts": ["aoc = aoc.cli:main"]},
 )
@@ -0,0 +1,82 @@
+"""Test the cellular automata."""
+from typing import Type, Union
+
+import numpy as np
+import pytest
+
+from aoc.automaton import (
+    HEX,
+    LIFE,
+    DenseAutomaton,
+    Rule,
+    SparseAutomaton,
+    count_neighbours,
+    moore,
+    pack,
+    unpack,
+    von_neumann,
+)
+
+Automaton = Union[Type[SparseAutomaton], Type[DenseAutomaton]]
+
+GLIDER = {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+
+
+@pytest.mark.parametrize("coord", ((0, 0), (3, -4), (-5, 7, -1), (-(2**19), 2**19 - 1)))
+def test_pack(coord: tuple) -> None:
+    """Check that packing is linear and that keys unpack to their coordinate."""
+    assert unpack(pack(coord), len(coord)) == coord
+    assert pack(coord) + pack((1,) * len(coord)) == pack(tuple(value + 1 for value in coord))
+
+
+def test_neighbourhoods() -> None:
+    """Check the number of neighbours of the neighbourhoods."""
+    assert [len(moore(2)), len(moore(3)), len(von_neumann(2)), len(von_neumann(3)), len(HEX)] == [8, 26, 4, 6, 6]
+
+
+@pytest.mark.parametrize("automaton_class", (SparseAutomaton, DenseAutomaton))
+def test_glider(automaton_class: Automaton) -> None:
+    """Check that a glider moves one cell diagonally every four generations in the game of life."""
+    automaton = automaton_class.from_cells(GLIDER, moore(), LIFE).run(80)
+    assert automaton.generation == 80
+    assert set(automaton.cells()) == {(x + 20, y + 20) for x, y in GLIDER}
+
+
+def test_dense_grows() -> None:
+    """Check that the array keeps a border of dead cells as the glider moves."""
+    automaton = DenseAutomaton.from_cells(GLIDER, moore(), LIFE)
+    for _ in range(40):
+        automaton.step()
+        grid = automaton.grid
+        assert not (grid[0].any() or grid[-1].any() or grid[:, 0].any() or grid[:, -1].any())
+    assert len(automaton) == 5
+
+
+def test_dense_hex() -> None:
+    """Check that both automata agree on random hex tiles."""
+    cells = [tuple(cell) for cell in np.argwhere(np.random.default_rng(0).random((30, 30)) < 0.3).tolist()]
+    rule = Rule(frozenset({2}), frozenset({1, 2}))
+    sparse = SparseAutomaton.from_cells(cells, HEX, rule).run(20)
+    assert set(DenseAutomaton.from_cells(cells, HEX, rule).run(20).cells()) == set(sparse.cells())
+
+
+def test_count_neighbours() -> None:
+    """Check that offsets are x, y and that cells outside the grid count as dead."""
+    grid = np.array([[1, 0, 0], [0, 0, 0]], dtype=bool)
+    assert count_neighbours(grid, [(1, 0)]).tolist() == [[0, 0, 0], [0, 0, 0]]
+    assert count_neighbours(grid, [(-1, 0)]).tolist() == [[0, 1, 0], [0, 0, 0]]
+    assert count_neighbours(grid, moore()).tolist() == [[0, 1, 0], [1, 1, 0]]
+
+
+@pytest.mark.parametrize(("survival", "survivors"), ((frozenset({1}), set()), (frozenset({0}), {(0, 0), (5, 5)})))
+def test_survival(survival: frozenset, survivors: set) -> None:
+    """Check von Neumann neighbours and that survival with 0 neighbours keeps isolated cells."""
+    automaton = SparseAutomaton.from_cells([(0, 0), (5, 5)], von_neumann(), Rule(frozenset({1}), survival))
+    born = {(x + dx, y + dy) for x, y in ((0, 0), (5, 5)) for dx, dy in von_neumann()}
+    assert set(automaton.run(1).cells()) == born | survivors
+
+
+def test_birth_without_neighbours() -> None:
+    """Check that rules that bring empty space alive are refused."""
+    with pytest.raises(ValueError):
+        Rule(frozenset({0}), frozenset())
@@ -0,0 +1,59 @@
+"""Test the answer cache."""
+import os
+from pathlib import Path
+
+import pytest
+
+from aoc.cache import AnswerCache, cache_key, cached_answer
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> Path:
+    """Write a solution and its input."""
+    (tmp_path / "part_1.py").write_text("def solve(text):\n    return len(text)\n")
+    (tmp_path / "input.txt").write_text("abc\n")
+    return tmp_path
+
+
+def test_cache_key(files: Path) -> None:
+    """Check that the key changes with the source and the input."""
+    solver_path, input_path = files / "part_1.py", files / "input.txt"
+    key = cache_key(solver_path, input_path)
+    assert cache_key(str(solver_path), str(input_path)) == key
+    input_path.write_text("abcd\n")
+    assert cache_key(solver_path, input_path) != key
+    input_path.write_text("abc\n")
+    solver_path.write_text("def solve(text):\n    return len(text) - 1\n")
+    assert cache_key(solver_path, input_path) != key
+
+
+def test_cached_answer(files: Path) -> None:
+    """Check that answers are computed once and that use_cache False recomputes without touching the cache."""
+    cache = AnswerCache(files / "cache")
+    calls = []
+
+    def compute() -> int:
+        calls.append(1)
+        return 4
+
+    args = (files / "part_1.py", files / "input.txt")
+    assert cached_answer(compute, *args, cache=cache) == 4
+    assert cached_answer(compute, *args, cache=cache) == "4"
+    assert len(calls) == 1
+    assert cached_answer(compute, *args, use_cache=False, cache=cache) == 4
+    assert len(calls) == 2
+    # Nothing is hashed, so a missing input is no problem
+    assert cached_answer(compute, files / "part_1.py", files / "missing.txt", use_cache=False, cache=cache) == 4
+
+
+def test_evict(tmp_path: Path) -> None:
+    """Check that the least recently used entries are removed once the cache is too large."""
+    cache = AnswerCache(tmp_path, max_bytes=10**6)
+    for i, key in enumerate("abc"):
+        cache.put(key, "x" * 100)
+        os.utime(tmp_path / f"{key}.json", (i, i))
+    assert cache.get("a") is not None
+    cache.max_bytes = 300
+    cache.evict()
+    assert sorted(path.stem for path in tmp_path.glob("*.json")) == ["a", "c"]
+    assert cache.get("b") is None
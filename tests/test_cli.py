@@ -0,0 +1,162 @@
+"""Test the aoc command line interface."""
+import json
+from pathlib import Path
+
+import pytest
+
+from aoc.cli import (
+    DURATIONS_FILE,
+    Result,
+    Task,
+    discover,
+    load_durations,
+    main,
+    run_parallel,
+    run_task,
+    save_durations,
+    slowest_first,
+)
+
+PART_S = '''\
+def solve(text: str) -> int:
+    """Solve the puzzle."""
+    return {answer}
+'''
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the cached answers of the tests out of the user cache."""
+    monkeypatch.setattr("aoc.cli.CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Build a tree with two years of solutions, the last part fails."""
+    for year, day, part, answer in ((2020, 1, 1, "len(text)"), (2021, 2, 1, "7"), (2021, 2, 2, "1 // 0")):
+        day_dir = tmp_path / str(year) / f"y_{year}_day_{day:02}"
+        day_dir.mkdir(parents=True, exist_ok=True)
+        (day_dir / f"part_{part}.py").write_text(PART_S.format(answer=answer))
+        (day_dir / "input.txt").write_text("abc\n")
+    (tmp_path / "2021" / "y_2021_day_02" / "helpers.py").write_text("")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    ("years", "days", "parts", "expected"),
+    (
+        (None, None, None, [(2020, 1, 1), (2021, 2, 1), (2021, 2, 2)]),
+        ([2021], None, None, [(2021, 2, 1), (2021, 2, 2)]),
+        (None, [1, 2], [1], [(2020, 1, 1), (2021, 2, 1)]),
+    ),
+)
+def test_discover(tree: Path, years: list, days: list, parts: list, expected: list) -> None:
+    """Check that only part files are found and that the filters apply."""
+    assert [(task.year, task.day, task.part) for task in discover(tree, years, days, parts)] == expected
+
+
+def test_run_task(tree: Path) -> None:
+    """Check that answers and errors end up in the result."""
+    first, _, failing = discover(tree)
+    assert run_task(first).answer == "4"
+    assert run_task(failing).error == "ZeroDivisionError: integer division or modulo by zero"
+    assert run_task(Task(2020, 1, 2, first.path.with_name("part_2.py"))).error is not None
+
+
+def test_run_task_load(tree: Path) -> None:
+    """Check that a part file can choose how its input is loaded."""
+    task = discover(tree)[0]
+    part_s = "from aoc.inputs import read_lines\n\nload = read_lines\n"
+    part_s += "\n\ndef solve(lines):\n    return type(lines).__name__\n"
+    task.path.write_text(part_s)
+    assert run_task(task).answer == "generator"
+
+
+def test_main(tree: Path, capsys: pytest.CaptureFixture) -> None:
+    """Check that the table is printed and that errors set the exit code."""
+    assert main(["run", "--root", str(tree), "--year", "2021", "--part", "1"]) == 0
+    output = capsys.readouterr().out
+    assert "2021   2    1" in output
+    assert "1 parts in" in output
+    assert main(["run", "--root", str(tree)]) == 1
+
+
+def test_run_parallel(tree: Path) -> None:
+    """Check that results come back from the child processes and that slow parts are killed."""
+    slow_part = tree / "2020" / "y_2020_day_01" / "part_2.py"
+    slow_part.write_text("import time\n\n\ndef solve(text: str) -> None:\n    time.sleep(60)\n")
+    results = {result.task.name: result for result in run_parallel(discover(tree), jobs=2, timeout=1)}
+    assert results["y_2020_day_01_part_1"].answer == "4"
+    assert results["y_2020_day_01_part_2"].error == "Timeout after 1 s"
+    assert results["y_2020_day_01_part_2"].timed_out
+    assert not results["y_2021_day_02_part_2"].timed_out
+    assert results["y_2021_day_02_part_2"].error is not None
+
+
+def test_slowest_first(tree: Path) -> None:
+    """Check that parts without a known duration go first, followed by the slowest ones."""
+    tasks = slowest_first(discover(tree), {(2020, 1, 1): 0.5, (2021, 2, 1): 2.0})
+    assert [task.name for task in tasks] == ["y_2021_day_02_part_2", "y_2021_day_02_part_1", "y_2020_day_01_part_1"]
+    tasks = slowest_first(discover(tree), {(2021, 2, 1): 2.0}, unknown=1.0)
+    assert [task.name for task in tasks] == ["y_2021_day_02_part_1", "y_2020_day_01_part_1", "y_2021_day_02_part_2"]
+
+
+def test_main_durations(tree: Path, cache_dir: Path, capsys: pytest.CaptureFixture) -> None:
+    """Check that without --durations a run starts the parts that were slowest in the last run first."""
+    assert main(["run", "--root", str(tree), "--year", "2021", "--no-cache"]) == 1
+    capsys.readouterr()
+    durations_path = cache_dir / DURATIONS_FILE
+    # The failing part took no time that says how slow it is
+    assert set(load_durations(durations_path)) == {(2021, 2, 1)}
+    durations_path.write_text(json.dumps([{"year": 2020, "day": 1, "part": 1, "seconds": 10.0}]))
+    assert main(["run", "--root", str(tree), "--no-cache"]) == 1
+    rows = capsys.readouterr().out.splitlines()
+    assert rows[1].startswith("2020   1    1")
+    # Runs of a few parts keep the durations of the others
+    assert main(["run", "--root", str(tree), "--year", "2021", "--no-cache"]) == 1
+    assert set(load_durations(durations_path)) == {(2020, 1, 1), (2021, 2, 1)}
+
+
+def test_main_json(tree: Path, tmp_path: Path) -> None:
+    """Check that the results of a parallel run are written as JSON."""
+    json_path = tmp_path / "results.json"
+    assert main(["run", "--root", str(tree), "--jobs", "2", "--json", str(json_path)]) == 1
+    results = json.loads(json_path.read_text())
+    assert [(result["year"], result["day"], result["part"]) for result in results] == [
+        (2020, 1, 1),
+        (2021, 2, 1),
+        (2021, 2, 2),
+    ]
+    assert results[1]["answer"] == "7"
+
+
+def test_main_cache(tree: Path, capsys: pytest.CaptureFixture) -> None:
+    """Check that a second run takes the answers from the cache, unless they changed or the cache is off."""
+    assert main(["run", "--root", str(tree), "--year", "2021"]) == 1
+    assert "(cached)" not in capsys.readouterr().out
+    assert main(["run", "--root", str(tree), "--year", "2021"]) == 1
+    output = capsys.readouterr().out
+    assert "7 (cached)" in output
+    assert "ZeroDivisionError" in output
+    (tree / "2021" / "y_2021_day_02" / "input.txt").write_text("changed\n")
+    assert main(["run", "--root", str(tree), "--year", "2021", "--part", "1"]) == 0
+    assert "(cached)" not in capsys.readouterr().out
+    assert main(["run", "--root", str(tree), "--year", "2021", "--part", "1", "--no-cache"]) == 0
+    assert "(cached)" not in capsys.readouterr().out
+
+
+def test_save_durations(tree: Path, tmp_path: Path) -> None:
+    """Check that errors keep the recorded duration and that timeouts only raise it."""
+    first, second, failing = discover(tree)
+    path = tmp_path / "durations.json"
+    save_durations(path, [Result(first, "4", 1.0), Result(second, "7", 5.0), Result(failing, "1", 5.0)])
+    save_durations(
+        path,
+        [
+            Result(first, error="Timeout after 3 s", seconds=3.0, timed_out=True),
+            Result(second, error="Timeout after 3 s", seconds=3.0, timed_out=True),
+            Result(failing, error="MemoryError: "),
+        ],
+    )
+    assert load_durations(path) == {(2020, 1, 1): 3.0, (2021, 2, 1): 5.0, (2021, 2, 2): 5.0}
@@ -1,7 +1,25 @@
 """Test compute module."""
+from typing import Callable, Iterator, List, Tuple
+
+import numpy as np
 import pytest
 
-from aoc.compute import run_intcode
+from aoc.compute import (
+    UNREACHED,
+    Coord,
+    IntcodeVM,
+    astar,
+    bfs,
+    chebyshev,
+    dijkstra,
+    grid_bfs,
+    grid_dijkstra,
+    grid_path,
+    manhattan,
+    reconstruct_path,
+    run_intcode,
+)
+from aoc.parsers import comma_separated_text_to_integer_array
 
 INPUT_S1 = """\
 1,0,0,0,99
@@ -36,5 +54,229 @@ INPUT_S5 = """\
 )
 def test_intcode(input_s: str, expected: int) -> None:
     """Check that the solution is correct."""
-    code = [int(x) for x in input_s.split(",")]
+    code = comma_separated_text_to_integer_array(input_s).tolist()
     assert run_intcode(code) == expected
+
+
+QUINE = "109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99"
+COMPARE_TO_8 = "3,9,8,9,10,9,4,9,99,-1,8"
+LARGE_OUTPUT = "104,1125899906842624,99"
+
+
+@pytest.mark.parametrize(
+    ("input_s", "inputs", "expected"),
+    (
+        (QUINE, [], [int(x) for x in QUINE.split(",")]),
+        (COMPARE_TO_8, [8], [1]),
+        (COMPARE_TO_8, [7], [0]),
+        (LARGE_OUTPUT, [], [1125899906842624]),
+        ("1102,34915192,34915192,7,4,7,99,0", [], [1219070632396864]),
+    ),
+)
+def test_intcode_vm(input_s: str, inputs: List[int], expected: List[int]) -> None:
+    """Check parameter modes, relative base, I/O and memory growth."""
+    vm = IntcodeVM([int(x) for x in input_s.split(",")], inputs)
+    assert vm.run() == expected
+    assert vm.halted
+
+
+def test_intcode_vm_invalid_instruction() -> None:
+    """Check an unknown opcode is reported."""
+    with pytest.raises(ValueError):
+        IntcodeVM([42, 0, 0, 0]).run()
+
+
+@pytest.mark.parametrize(
+    "code",
+    (
+        # Jump past the end of memory and before its start
+        [1105, 1, 100],
+        [1105, 1, -1],
+        # Run off the end without halting
+        [1101, 1, 1, 0],
+    ),
+)
+def test_intcode_vm_invalid_instruction_address(code: List[int]) -> None:
+    """Check an instruction pointer outside of memory is reported."""
+    with pytest.raises(ValueError, match="Invalid intcode instruction"):
+        IntcodeVM(code).run()
+
+
+@pytest.mark.parametrize(
+    "code",
+    (
+        # Read from, write to and read relative to a negative address
+        [1, -1, 0, 0, 99],
+        [1101, 1, 1, -2, 99],
+        [109, -5, 204, 0, 99],
+    ),
+)
+def test_intcode_vm_negative_address(code: List[int]) -> None:
+    """Check negative addresses are rejected instead of indexing from the end of memory."""
+    vm = IntcodeVM(code)
+    with pytest.raises(ValueError, match="Negative intcode address"):
+        vm.run()
+    assert vm.memory.tolist() == code
+
+
+def test_run_intcode_leaves_code_untouched() -> None:
+    """Check the caller's list is not mutated."""
+    code = [1, 0, 0, 0, 99]
+    assert run_intcode(code) == [2, 0, 0, 0, 99]
+    assert code == [1, 0, 0, 0, 99]
+
+
+def test_intcode_vm_pauses_for_input() -> None:
+    """Check the VM waits for input and resumes where it left off."""
+    # Output the sum of two inputs
+    vm = IntcodeVM([3, 11, 3, 12, 1, 11, 12, 13, 4, 13, 99, 0, 0, 0])
+    assert vm.run() == []
+    assert vm.waiting_for_input
+    vm.inputs.append(2)
+    assert vm.run() == []
+    vm.inputs.append(40)
+    assert vm.run() == [42]
+    assert vm.halted and not vm.waiting_for_input
+
+
+@pytest.mark.parametrize("grow_memory", (False, True))
+def test_intcode_vm_snapshot_restore(grow_memory: bool) -> None:
+    """Check restoring a snapshot undoes writes, memory growth and I/O."""
+    code = [3, 11, 3, 12, 1, 11, 12, 13, 4, 13, 99, 0, 0, 0]
+    if grow_memory:
+        # Store the sum far past the end of the program
+        code[7], code[9] = 1000, 1000
+    vm = IntcodeVM(code)
+    vm.run()
+    snapshot = vm.snapshot()
+    vm.inputs.extend([1, 2])
+    assert vm.run() == [3]
+    vm.restore(snapshot)
+    assert vm.memory.tolist() == code
+    assert vm.waiting_for_input and not vm.halted
+    vm.inputs.extend([5, 6])
+    assert vm.run() == [11]
+    # Restoring an older state copies the full memory
+    other = IntcodeVM(code)
+    other.restore(snapshot)
+    other.inputs.extend([1, 1])
+    assert other.run() == [2]
+
+
+def test_intcode_vm_restore_after_negative_write() -> None:
+    """Check a write to a negative address neither changes memory nor escapes restore."""
+    # Store 14 at address 9, then try to store 2 at address -1, which used to be address 9 as well
+    code = [1101, 7, 7, 9, 1101, 1, 1, -1, 99, 0]
+    vm = IntcodeVM(code)
+    snapshot = vm.snapshot()
+    with pytest.raises(ValueError):
+        vm.run()
+    assert vm.memory[9] == 14
+    vm.restore(snapshot)
+    assert vm.memory.tolist() == code
+
+
+GRID_S = """\
+1163
+1381
+2136
+3694
+"""
+
+
+def test_grid_dijkstra() -> None:
+    """Check path costs and parents on a small grid."""
+    grid = np.array([[int(c) for c in line] for line in GRID_S.splitlines()])
+    parents, costs = grid_dijkstra(grid, (0, 0))
+    assert costs.shape == grid.shape
+    assert costs[0, 0] == 0
+    assert costs[-1, -1] == 17
+    # Walk the parents back from the end to the start
+    node, path_cost = grid.size - 1, 0
+    while node != 0:
+        path_cost += grid.flat[node]
+        node = parents.flat[node]
+    assert path_cost == costs[-1, -1]
+
+
+def test_dijkstra_targets() -> None:
+    """Check the search stops once the targets are settled."""
+    line_graph = {(x, 0): {(x + dx, 0): 1 for dx in (-1, 1) if 0 <= x + dx < 10} for x in range(10)}
+    _, node_costs = dijkstra(line_graph, (0, 0), targets={(3, 0)})
+    assert node_costs[(3, 0)] == 3
+    assert (5, 0) not in node_costs
+    _, full_costs = dijkstra(line_graph, (0, 0))
+    assert full_costs[(9, 0)] == 9
+
+
+def test_grid_dijkstra_targets() -> None:
+    """Check the grid search stops once the target is settled."""
+    grid = np.ones((1, 10), dtype=int)
+    _, costs = grid_dijkstra(grid, (0, 0), targets={(3, 0)})
+    assert costs[0, 3] == 3
+    assert costs[0, 5] == -1
+
+
+def test_dijkstra_neighbor_callback() -> None:
+    """Check dijkstra accepts a callback that generates edges on demand."""
+
+    def neighbors(node: Coord) -> Iterator[Tuple[Coord, int]]:
+        x, y = node
+        for adj_node in ((x + 1, y), (x, y + 1)):
+            yield adj_node, 2
+
+    _, node_costs = dijkstra(neighbors, (0, 0), targets={(3, 4)})
+    assert node_costs[(3, 4)] == 14
+
+
+@pytest.mark.parametrize(
+    ("heuristic", "expected_max_expanded"),
+    (
+        (lambda node, goal: 0, 100),
+        (manhattan, 19),
+    ),
+)
+def test_astar(heuristic: Callable[[Coord, Coord], int], expected_max_expanded: int) -> None:
+    """Check A* finds the dijkstra cost and that a heuristic prunes the search."""
+    coords = [(x, y) for x in range(10) for y in range(10)]
+    graph = {(x, y): {(x + dx, y + dy): 1 for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))} for x, y in coords}
+    graph = {node: {adj: w for adj, w in edges.items() if adj in graph} for node, edges in graph.items()}
+    _, node_costs, n_expanded = astar(graph, (0, 0), (9, 0), heuristic)
+    assert node_costs[(9, 0)] == dijkstra(graph, (0, 0))[1][(9, 0)] == 9
+    assert n_expanded <= expected_max_expanded
+
+
+def test_chebyshev() -> None:
+    """Check the chebyshev distance."""
+    assert chebyshev((0, 0), (3, -5)) == 5
+    assert manhattan((0, 0), (3, -5)) == 8
+
+
+def test_bfs() -> None:
+    """Check multi-source BFS distances, early exit and path reconstruction."""
+    a, b, c, d, e, x = (0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (3, 1)
+    graph = {a: [b], b: [c], c: [d], x: [d], d: [e]}
+    parents_map, distances = bfs(graph, [a, x])
+    assert distances == {a: 0, x: 0, b: 1, d: 1, c: 2, e: 2}
+    assert reconstruct_path(parents_map, e) == [x, d, e]
+    _, distances = bfs(graph, [a], targets={c})
+    assert d not in distances
+
+
+def test_grid_bfs() -> None:
+    """Check the grid BFS respects can_move and rebuilds the path."""
+    grid = np.array(
+        [
+            [0, 0, 1],
+            [1, 1, 0],
+            [0, 0, 0],
+        ]
+    )
+    parents, distances = grid_bfs(grid, [(0, 0)], lambda value, next_value: next_value == 0)
+    assert distances[2, 0] == UNREACHED
+    assert distances[0, 1] == 1
+    _, distances = grid_bfs(grid, [(2, 2)], lambda value, next_value: next_value == 0)
+    assert distances[2, 0] == 2
+    parents, distances = grid_bfs(grid, [(2, 2), (0, 0)], lambda value, next_value: True, targets={(2, 0)})
+    assert distances[0, 2] == 2
+    assert grid_path(parents, (2, 0)) == [(2, 2), (2, 1), (2, 0)]
@@ -0,0 +1,32 @@
+"""Test that generated inputs can be solved."""
+from pathlib import Path
+
+import pytest
+
+from aoc.cli import Task, discover, load_solver
+from aoc.gen import get_generator
+
+REPO_ROOT = Path(__file__).parent.parent
+# Small sizes that keep every part fast, including the exponential and quadratic ones
+SIZES = {(2020, 25): 10_000, (2021, 11): 10, (2021, 12): 5, (2021, 16): 3, (2022, 11): 4}
+TASKS = [task for task in discover(REPO_ROOT) if task.day > 0]
+# Generators must hold for any seed, a single seed misses inputs that only some seeds produce
+SEEDS = range(5)
+
+
+@pytest.mark.parametrize("task", TASKS, ids=[task.name for task in TASKS])
+def test_generated_input_is_solved(task: Task) -> None:
+    """Check that every implemented part solves small generated inputs of several seeds."""
+    generator = get_generator(task.year, task.day)
+    solver = load_solver(task)
+    size = SIZES.get((task.year, task.day), 50)
+    for seed in SEEDS:
+        text = generator(size, seed=seed)
+        assert generator(size, seed=seed) == text
+        solver.solve(text)
+
+
+def test_get_generator_unknown_day() -> None:
+    """Check that days without a generator raise a KeyError."""
+    with pytest.raises(KeyError):
+        get_generator(2021, 26)
@@ -0,0 +1,38 @@
+"""Test input readers."""
+from pathlib import Path
+
+import pytest
+
+from aoc.inputs import iter_lines, map_input, read_lines
+from aoc.parsers import text_to_byte_grid
+
+
+@pytest.mark.parametrize(
+    "lines",
+    ("noop\naddx 3\n\naddx -5", "noop\r\naddx 3\r\n\r\naddx -5\r\n", ["noop\n", "addx 3\n", "\n", "addx -5\n"]),
+)
+def test_iter_lines(lines: str) -> None:
+    """Check that text and iterables of lines give the same lines without line endings."""
+    assert list(iter_lines(lines)) == ["noop", "addx 3", "", "addx -5"]
+
+
+def test_read_lines(tmp_path: Path) -> None:
+    """Check that a file is read lazily and closed when the lines are exhausted."""
+    path = tmp_path / "input.txt"
+    path.write_text("R 4\nU 4\n")
+    lines = read_lines(path, buffer_size=2)
+    assert next(lines) == "R 4"
+    assert list(lines) == ["U 4"]
+
+
+@pytest.mark.parametrize(("content", "expected"), ((b"12\n34\n", [[1, 2], [3, 4]]), (b"", None)))
+def test_map_input(tmp_path: Path, content: bytes, expected: list) -> None:
+    """Check that a mapped file is wrapped by the byte grid parser without a copy."""
+    path = tmp_path / "input.txt"
+    path.write_bytes(content)
+    view = map_input(path)
+    assert view.tobytes() == content
+    if expected is not None:
+        grid = text_to_byte_grid(view)
+        assert not grid.flags.owndata
+        assert (grid - ord("0")).tolist() == expected
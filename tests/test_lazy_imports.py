@@ -0,0 +1,57 @@
+"""Test that running a solution does not import packages it does not need."""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import aoc
+from aoc.testing import parametrize
+
+REPO_ROOT = Path(__file__).parent.parent
+IMPORTED_S = "import runpy, sys; runpy.run_path(sys.argv[1]); print(' '.join(sorted(sys.modules)))"
+
+
+def imported_modules(code: str, *args: str) -> set:
+    """Run code in a new interpreter and return the modules it imported."""
+    process = subprocess.run([sys.executable, "-c", code, *args], capture_output=True, text=True, check=True)
+    return set(process.stdout.split())
+
+
+def test_package() -> None:
+    """Check that importing aoc does not import NumPy, but that its submodules are attributes of the package."""
+    assert "numpy" not in imported_modules("import sys, aoc; print(' '.join(sys.modules))")
+    modules = imported_modules("import sys, aoc; aoc.parsers; print(' '.join(sys.modules))")
+    assert {"aoc.parsers", "numpy"} <= modules
+    with pytest.raises(AttributeError):
+        getattr(__import__("aoc"), "missing")
+
+
+def test_submodules() -> None:
+    """Check that every module and package in aoc can be accessed as an attribute of the package."""
+    package_dir = Path(aoc.__file__).parent
+    modules = {path.stem for path in package_dir.glob("*.py") if path.name != "__init__.py"}
+    packages = {path.parent.name for path in package_dir.glob("*/__init__.py")}
+    assert set(aoc.SUBMODULES) == modules | packages
+
+
+@pytest.mark.parametrize(
+    ("part", "lazy"), (("2021/y_2021_day_09/part_2.py", "scipy"), ("2022/y_2022_day_01/part_1.py", "numpy"))
+)
+def test_part(part: str, lazy: str) -> None:
+    """Check that neither pytest nor packages only used by solve are imported with a solution."""
+    modules = imported_modules(IMPORTED_S, str(REPO_ROOT / part))
+    assert "pytest" not in modules
+    assert lazy not in modules
+
+
+def test_parametrize(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that tests are only marked when pytest is imported."""
+
+    def test() -> None:
+        """Do nothing."""
+
+    assert parametrize("x", [1])(test).pytestmark[0].args == ("x", [1])  # type: ignore[attr-defined]
+    monkeypatch.delitem(sys.modules, "pytest")
+    del test.pytestmark  # type: ignore[attr-defined]
+    assert not hasattr(parametrize("x", [1])(test), "pytestmark")
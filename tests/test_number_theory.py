@@ -0,0 +1,71 @@
+"""Test the modular arithmetic."""
+import math
+
+import pytest
+
+from aoc.number_theory import (
+    baby_step_giant_step,
+    crt,
+    discrete_log,
+    factorize,
+    is_prime,
+    multiplicative_order,
+    totient,
+)
+
+# A 59 bit prime p where p - 1 = 2 * 14923 * 19267 * 25171 * 32801
+SMOOTH_PRIME = 474774938160944423
+
+
+@pytest.mark.parametrize(
+    ("n", "expected"),
+    (
+        (20201226, {2: 1, 3: 1, 29: 1, 116099: 1}),
+        (2**10 * 3**4, {2: 10, 3: 4}),
+        (1073741831 * 536870923, {536870923: 1, 1073741831: 1}),
+        (SMOOTH_PRIME - 1, {2: 1, 14923: 1, 19267: 1, 25171: 1, 32801: 1}),
+        (1, {}),
+    ),
+)
+def test_factorize(n: int, expected: dict) -> None:
+    """Check prime factors with multiplicities, also of a 60 bit semiprime."""
+    assert factorize(n) == expected
+
+
+def test_is_prime() -> None:
+    """Check Miller-Rabin against trial division and on strong pseudoprimes."""
+    assert [n for n in range(200) if is_prime(n)] == [n for n in range(2, 200) if all(n % d for d in range(2, n))]
+    assert not is_prime(3215031751)
+    assert is_prime(SMOOTH_PRIME)
+
+
+def test_orders() -> None:
+    """Check the totient, the order of an element and the Chinese remainder theorem."""
+    assert totient(36) == 12
+    assert multiplicative_order(2, 7) == 3
+    assert multiplicative_order(7, 20201227) == 20201226
+    assert crt([2, 3, 2], [3, 5, 7]) == (23, 105)
+
+
+@pytest.mark.parametrize(
+    ("base", "exponent", "modulus"),
+    ((7, 8, 20201227), (7, 11, 20201227), (3, 123456789123456, SMOOTH_PRIME), (2, 10, 1000003), (5, 17, 36)),
+)
+def test_discrete_log(base: int, exponent: int, modulus: int) -> None:
+    """Check that the smallest exponent is found, also modulo a 60 bit prime and a composite."""
+    x = discrete_log(base, pow(base, exponent, modulus), modulus)
+    assert x == exponent % multiplicative_order(base, modulus)
+
+
+def test_baby_step_giant_step() -> None:
+    """Check the smallest exponent within the order and None when there is none."""
+    assert baby_step_giant_step(7, pow(7, 123456, 20201227), 20201227, 20201226) == 123456
+    assert baby_step_giant_step(2, 3, 7, 3) is None
+
+
+@pytest.mark.parametrize(("base", "target", "modulus"), ((2, 3, 7), (6, 1, 9)))
+def test_discrete_log_without_solution(base: int, target: int, modulus: int) -> None:
+    """Check that targets outside the subgroup of the base and bases that are not invertible raise ValueError."""
+    assert math.gcd(base, modulus) != 1 or target not in {pow(base, k, modulus) for k in range(modulus)}
+    with pytest.raises(ValueError):
+        discrete_log(base, target, modulus)
@@ -0,0 +1,28 @@
+"""Test parallel module."""
+from typing import Iterator
+
+from aoc.parallel import parallel_map, sweep
+
+
+def power(exponent: int, x: int) -> int:
+    """Raise x to the shared exponent."""
+    return int(x**exponent)
+
+
+def test_parallel_map() -> None:
+    """Check every item is computed once with the shared payload."""
+    results = dict(parallel_map(power, range(100), payload=2, max_workers=2, chunk_size=7))
+    assert results == {x: x**2 for x in range(100)}
+
+
+def test_sweep() -> None:
+    """Check the sweep stops at a hit, also on an endless iterator."""
+
+    def endless() -> Iterator[int]:
+        x = 0
+        while True:
+            yield x
+            x += 1
+
+    assert sweep(power, endless(), lambda result: result == 3**3, payload=3, max_workers=2) == (3, 27)
+    assert sweep(power, range(10), lambda result: result < 0, payload=3, max_workers=2) is None
@@ -1,6 +1,9 @@
 """Test parsers."""
 
-from aoc.parsers import text_to_integer_array
+import numpy as np
+import pytest
+
+from aoc.parsers import comma_separated_text_to_integer_array, text_to_byte_grid, text_to_integer_array
 
 
 def test_text_to_integer_array(integers_as_text: str) -> None:
@@ -9,3 +12,59 @@ def test_text_to_integer_array(integers_as_text: str) -> None:
     assert len(array) == 10
     assert array[0].dtype == int
     assert sum(array) == 2256
+
+
+def test_comma_separated_text_to_integer_array() -> None:
+    """Test the comma_separated_text_to_integer_array function."""
+    array = comma_separated_text_to_integer_array("3,4,-3,1,2\n", dtype=np.int32)
+    assert array.dtype == np.int32
+    assert array.tolist() == [3, 4, -3, 1, 2]
+
+
+def test_integer_array_rejects_garbage() -> None:
+    """Test that unparseable text raises instead of silently truncating."""
+    with pytest.raises(ValueError):
+        text_to_integer_array("1\nx\n3\n")
+
+
+@pytest.mark.parametrize(
+    ("text", "dtype"),
+    (
+        ("1\n9223372036854775808\n", np.int64),
+        ("1\n-9223372036854775809\n", np.int64),
+        ("1\n300\n", np.int8),
+        ("-1\n", np.uint32),
+    ),
+)
+def test_integer_array_rejects_out_of_range(text: str, dtype: type) -> None:
+    """Test that integers that do not fit in the dtype raise instead of saturating or wrapping around."""
+    with pytest.raises(ValueError):
+        text_to_integer_array(text, dtype=dtype)
+
+
+def test_integer_array_keeps_limits() -> None:
+    """Test that integers exactly at the limits of int64 are kept."""
+    text = "9223372036854775807\n-9223372036854775808\n"
+    assert text_to_integer_array(text).tolist() == [2**63 - 1, -(2**63)]
+
+
+@pytest.mark.parametrize(
+    ("text", "subtract", "expected"),
+    (
+        ("123\n456\n", "0", [[1, 2, 3], [4, 5, 6]]),
+        (b"ab\ncz", "a", [[0, 1], [2, 25]]),
+        (memoryview(b"S.\n.E\n"), None, [[ord("S"), ord(".")], [ord("."), ord("E")]]),
+    ),
+)
+def test_text_to_byte_grid(text: str, subtract: str, expected: list) -> None:
+    """Test that str, bytes and memoryview maps are decoded, with and without a trailing newline."""
+    grid = text_to_byte_grid(text, subtract)
+    assert grid.dtype == np.uint8
+    assert grid.tolist() == expected
+
+
+@pytest.mark.parametrize("text", ("12\n3\n", "12\n345\n", "\n", ""))
+def test_text_to_byte_grid_rejects_ragged_lines(text: str) -> None:
+    """Test that lines of different lengths raise instead of being misaligned."""
+    with pytest.raises(ValueError):
+        text_to_byte_grid(text)
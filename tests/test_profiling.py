@@ -0,0 +1,63 @@
+"""Test the per phase profiling."""
+import pstats
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from aoc.profiling import PROFILER, phase, profiled, solve_profiled
+
+
+@profiled()
+def parse(text: str) -> List[int]:
+    """Parse comma separated numbers."""
+    return [int(number) for number in text.split(",")]
+
+
+@profiled("count_down")
+def count_down(n: int) -> int:
+    """Count down recursively."""
+    return 0 if n == 0 else count_down(n - 1)
+
+
+def solve(text: str) -> int:
+    """Sum the numbers after counting down from each."""
+    numbers = parse(text)
+    with phase("sum"):
+        total = sum(bytearray(1_000_000)) + sum(numbers)
+    for number in numbers:
+        count_down(number)
+    return total
+
+
+def test_profile_phases(capsys: pytest.CaptureFixture) -> None:
+    """Check that calls are counted per phase and memory of nested phases counts towards the outer phases."""
+    assert solve_profiled(solve, "1,2,3", "") == 6
+    stats = PROFILER.stats
+    assert {name: phase_stats.calls for name, phase_stats in stats.items()} == {
+        "solve": 1,
+        "parse": 1,
+        "sum": 1,
+        "count_down": 9,
+    }
+    assert stats["sum"].peak_bytes >= 1_000_000
+    assert stats["solve"].peak_bytes >= stats["sum"].peak_bytes
+    assert stats["solve"].seconds >= stats["sum"].seconds
+    assert "count_down" in capsys.readouterr().out
+
+
+def test_profile_disabled(capsys: pytest.CaptureFixture) -> None:
+    """Check that phases are not measured without the profile flag."""
+    PROFILER.stats = {}
+    assert solve_profiled(solve, "4", None) == 4
+    assert PROFILER.stats == {}
+    assert capsys.readouterr().out == ""
+
+
+def test_profile_pstats(tmp_path: Path) -> None:
+    """Check that the cProfile of the slowest phase is written to the given file."""
+    path = tmp_path / "solve.pstats"
+    assert solve_profiled(solve, "1", str(path)) == 1
+    assert PROFILER.cprofile is None
+    functions = {function for _, _, function in pstats.Stats(str(path)).stats}  # type: ignore[attr-defined]
+    assert "parse" not in functions
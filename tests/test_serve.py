@@ -0,0 +1,70 @@
+"""Test the warm solution server."""
+import os
+import threading
+import time
+from pathlib import Path
+
+from aoc.cli import Task, discover
+from aoc.serve import WarmSolvers, serve, solve_remote
+
+PART_S = '''\
+def solve(text: str) -> int:
+    """Solve the puzzle."""
+    print("solving")
+    return {answer}
+'''
+
+
+def write_part(tmp_path: Path, answer: str) -> Path:
+    """Write a part file and its input, the modification time changes on every call."""
+    day_dir = tmp_path / "2021" / "y_2021_day_01"
+    day_dir.mkdir(parents=True, exist_ok=True)
+    (day_dir / "input.txt").write_text("abc\n")
+    path = day_dir / "part_1.py"
+    mtime = path.stat().st_mtime_ns + 10**9 if path.exists() else time.time_ns()
+    path.write_text(PART_S.format(answer=answer))
+    os.utime(path, ns=(mtime, mtime))
+    return path
+
+
+def test_warm_solvers(tmp_path: Path) -> None:
+    """Check that part files are only imported again when they changed."""
+    write_part(tmp_path, "len(text)")
+    solvers = WarmSolvers()
+    (task,) = discover(tmp_path)
+    solvers.preload([task])
+    assert [(result["answer"], result["reloaded"]) for result in (solvers.solve(task), solvers.solve(task))] == [
+        ("4", False),
+        ("4", False),
+    ]
+    write_part(tmp_path, "1 // 0")
+    result = solvers.solve(task)
+    assert result["reloaded"]
+    assert result["stdout"] == "solving\n"
+    assert result["error"].startswith("ZeroDivisionError")
+
+
+def test_serve(tmp_path: Path) -> None:
+    """Check that tasks sent over the socket are solved by the server, and only the part files it found."""
+    write_part(tmp_path, "len(text)")
+    # Not a part file the server found, so it must not be run
+    other = tmp_path / "other.py"
+    socket_path = tmp_path / "aoc.sock"
+    # A daemon thread does not keep the test run alive when the server gets stuck
+    server = threading.Thread(target=serve, args=(tmp_path, socket_path, 1), daemon=True)
+    server.start()
+    deadline = time.monotonic() + 10
+    while not socket_path.exists():
+        assert server.is_alive(), "The server stopped before it listened"
+        assert time.monotonic() < deadline, "The server did not listen within 10 s"
+        time.sleep(0.01)
+    other.write_text(PART_S.format(answer="open(__file__ + '.ran', 'w').close()"))
+    tasks = [*discover(tmp_path), Task(2021, 2, 1, other), *discover(tmp_path)]
+    results = list(solve_remote(tasks, socket_path))
+    assert [result.answer for result in results] == ["4", None, "4"]
+    assert str(results[1].error).startswith("Bad request")
+    assert not Path(f"{other}.ran").exists()
+    assert socket_path.stat().st_mode & 0o777 == 0o600
+    server.join(timeout=10)
+    assert not server.is_alive()
+    assert not socket_path.exists()